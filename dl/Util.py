@@ -25,7 +25,8 @@ import mimetypes
 import random
 import string
 import re
-from functools import partial
+from functools import lru_cache
+from types import MethodType
 from urllib.parse import urlencode          # Python 3
 
 try:
@@ -59,7 +60,6 @@ class MultiMethod(object):
         self.name = name
         self.func = func
         self.cm = cm
-        self.obj = None
         self.nargs = None
         self.methodmap = {}
 
@@ -68,37 +68,30 @@ class MultiMethod(object):
         '''
         # DEBUG - Above docstring roduces the 'Call Docstring' in ipython '??'
 
-        # Lookup the function to call in the method map.
-        if self.cm:
-            reg_name = self.module + '.' + self.name + '.' + str(len(args)-1)
-        else:
-            reg_name = self.module + '.' + self.name + '.' + str(len(args))
-        function = self.methodmap.get(reg_name)
+        # Lookup the function to call in the method map.  The map is keyed
+        # by the number of positional args, for class methods the first
+        # arg is the bound object passed by __get__().
+        nargs = (len(args) - 1 if self.cm else len(args))
+        function = self.methodmap.get(nargs)
         if function is None:
-            raise TypeError("No MultiFunction match found for " + reg_name)
+            raise TypeError("No MultiFunction match found for %s.%s.%d" %
+                            (self.module, self.name, nargs))
 
         # Call the function with all original args/keywords and return result.
-        if self.cm:
-            return function(self.obj, *args, **kw)
-        else:
-            return function(*args, **kw)
+        return function(*args, **kw)
 
     def __repr__(self):
         return self.func.__repr__()
 
     def __get__(self, obj, objtype):
-        self.obj = obj
-        f = partial(self.__call__, obj)
-        f.__doc__ = self.func.__doc__
-        f.__dict__ = self.func.__dict__
-        f.__module__ = self.func.__module__
-        f.__defaults__ = self.func.__defaults__
-        if self.cm:
-            f.__dir__ = dir(self.obj)
-        #return partial(self.__call__, obj)
-        return f
+        # Bind as a plain method, the doc and other attributes are looked
+        # up on this object through the properties below.
+        if obj is None:
+            return self
+        return MethodType(self, obj)
 
     __doc__ = property(lambda self:self.func.__doc__)
+    __defaults__ = property(lambda self:self.func.__defaults__)
     __annotations__ = property(lambda self:self.func.__annotations__)
     __name__ = property(lambda self:self.func.__name__)
     __module__ = property(lambda self:self.func.__module__)
@@ -110,13 +103,13 @@ class MultiMethod(object):
     def register(self, nargs, function, module):
         '''Register the method based on the number of method arguments.
            Duplicates are rejected when two method names with the same
-           number of arguments are registered.  For generality, we
-           construct a registry id from the method name and no. of args.
+           number of arguments are registered.  Each MultiMethod holds a
+           single name in a single module, so the no. of args is enough
+           to identify the method.
         '''
-        reg_name = module + '.' + function.__name__ + '.' + str(nargs)
-        if reg_name in self.methodmap:
+        if nargs in self.methodmap:
             raise TypeError("duplicate registration")
-        self.methodmap[reg_name] = function
+        self.methodmap[nargs] = function
         self.func = function
         self.nargs = nargs
 
@@ -158,18 +151,47 @@ def multimethod(module, nargs, cm):
 ANON_TOKEN	= 'anonymous.0.0.anon_access'
 TOK_DEBUG	= False
 
+# Cache of values read from the token and dl.conf files.  Entries are keyed
+# by the file's modification time and size so that a login or logout that
+# rewrites the file is seen on the next call.
+_file_cache = {}
+
+def _cachedRead(path, reader):
+    '''Return reader(path), reusing the last value if the file hasn't
+       changed.  Raises OSError if the file doesn't exist.
+    '''
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    ent = _file_cache.get(path)
+    if ent is None or ent[0] != key:
+        ent = _file_cache[path] = (key, reader(path))
+    return ent[1]
+
+
+def _readToken(tok_file):
+    with open(tok_file, "r") as tok_fd:
+        return tok_fd.read(128).strip('\n')    # read the old token
+
+
+def _readLoginConf(conf_file):
+    config = ConfigParser.RawConfigParser(allow_no_value=True)
+    config.read(conf_file)
+    _status = config.get('login','status')
+    _user = (config.get('login','user') if _status == 'loggedin' else None)
+    return (_status, _user)
+
+
 #  READTOKENFILE -- Read the contents of the named token file.  If it
 #  doesn't exist, default to the anonymous token.
 #
 def readTokenFile (tok_file):
     if TOK_DEBUG: print ('readTokenFile: ' + tok_file)
-    if not os.path.exists(tok_file):
+    try:
+        user_tok = _cachedRead(tok_file, _readToken)
+    except OSError:
         if TOK_DEBUG: print ('returning ANON_TOKEN')
         return ANON_TOKEN 			# FIXME -- print a warning?
     else:
-        tok_fd = open(tok_file, "r")
-        user_tok = tok_fd.read(128).strip('\n') # read the old token
-        tok_fd.close()
         if TOK_DEBUG: print ('returning user_tok: ' + user_tok)
         return user_tok				# return named user tok
 
@@ -213,13 +235,10 @@ def def_token(tok):
     if tok is None or tok == '':
 
         # Read the $HOME/.datalab/dl.conf file
-        config = ConfigParser.RawConfigParser(allow_no_value=True)
         if os.path.exists('%s/dl.conf' % home):
-            config.read('%s/dl.conf' % home)
-            _status = config.get('login','status')
+            _status, _user = _cachedRead('%s/dl.conf' % home, _readLoginConf)
             if _status == 'loggedin':
                 # Return the currently logged-in user.
-                _user = config.get('login','user')
                 tok_file = ('%s/id_token.%s' % (home, _user))
                 if TOK_DEBUG: print ('returning loggedin user: %s' % tok_file)
                 return readTokenFile(tok_file)
@@ -244,7 +263,7 @@ def def_token(tok):
         if is_auth_token(tok):                # is it a token?
             if TOK_DEBUG: print ('returning input tok:  ' + tok)
             return tok
-        elif len(tok.split('.')) == 1:			# user name maybe?
+        elif '.' not in tok:				# user name maybe?
             tok_file = ('%s/id_token.%s' % (home, tok))
             return readTokenFile(tok_file)
         else:
@@ -252,6 +271,10 @@ def def_token(tok):
             return ANON_TOKEN
 
 
+# Compiled auth token pattern, see parse_auth_token() for details.
+_AUTH_TOKEN_RE = re.compile(
+    r'([^\/\s]+)\.(\d+)\.(\d+)\.((?:\$1\$\S{22,})|(?:\S+_access))')
+
 def parse_auth_token(token):
     """Parses string argument token
     Usage:
@@ -290,9 +313,10 @@ def parse_auth_token(token):
                           dldemo.99999.99999.demo_access
     """
 
-    return re.match(r'([^\/\s]+)\.(\d+)\.(\d+)\.((?:\$1\$\S{22,})|(?:\S+_access))', token)
+    return _AUTH_TOKEN_RE.match(token)
 
 
+@lru_cache(maxsize=16)
 def split_auth_token(token):
     """ Given an auth token split it in its components
     Usage:
@@ -1501,7 +1501,7 @@ def mydb_index(token, table, column, q3c=None, cluster=False, async_=False):
 @multimethod('qc',2,False)
 def mydb_index(opt1, opt2, token=None, q3c=None, cluster=False,
                async_=False):
-    if q3c is not None and len(opt1.split('.')) >= 4:
+    if q3c is not None and is_auth_token(opt1):
         # opt1 looks like a token, and q3c is set so opt2 must be a table.
         return qc_client._mydb_index(token=def_token(opt1), table=opt2,
                                      column='', q3c=q3c, cluster=cluster,
@@ -2996,7 +2996,7 @@ class queryClient (object):
                     async_=False):
         '''Usage::  queryClient.mydb_index (table, colunm)
         '''
-        if q3c is not None and len(opt1.split('.')) >= 4:
+        if q3c is not None and is_auth_token(opt1):
             # opt1 looks like a token and q3c is set, opt2 must be a table
             return self._mydb_index(token=def_token(opt1), table=opt2,
                                     column='', q3c=q3c, cluster=cluster,
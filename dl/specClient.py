@@ -65,9 +65,13 @@ import os
 import sys
 import socket
 import json
+import functools
 import numpy as np
 import pandas as pd
 from io import BytesIO
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from PIL import Image
 
@@ -88,12 +92,17 @@ from astropy import units as u
 from astropy.nddata import InverseVariance
 from astropy.table import Table
 from matplotlib import pyplot as plt      	# visualization libs
+from matplotlib.collections import LineCollection
 
 try:
     import pycurl_requests as requests		# faster 'requests' lib
 except ImportError:
     import requests
-import pycurl					# low-level interface
+import requests as _requests
+try:
+    import orjson				# fast numpy-aware JSON
+except ImportError:
+    orjson = None
 from urllib.parse import quote_plus		# URL encoding
 
 # Data Lab imports.
@@ -176,6 +185,36 @@ class dlSpecError(Exception):
         return self.message
 
 
+# ###################################
+#  HTTP Session Utilities
+# ###################################
+
+def _newSession():
+    '''Create a persistent HTTP session for service calls.  The session
+       keeps connections alive between calls (urllib3 already disables
+       Nagle's algorithm on them).  Note this is always a 'requests'
+       session:  the pycurl_requests Session reuses one cURL handle
+       without resetting its upload options, so a GET following a POST
+       fails.
+    '''
+    return _requests.Session()
+
+
+@functools.lru_cache(maxsize=8)
+def _tokenHeaders(tok, hostip, hostname):
+    '''Build the tracking headers for a token.  The result is cached since
+       the token is the same for nearly every call in a session; callers
+       must copy it before modifying it.
+    '''
+    user, uid, gid, hash = tok.strip().split('.', 3)
+    return {'Content-Type': 'text/ascii',
+            'X-DL-ClientVersion': __version__,
+            'X-DL-OriginIP': hostip,
+            'X-DL-OriginHost': hostname,
+            'X-DL-User': user,
+            'X-DL-AuthToken': tok}
+
+
 # ###################################
 #  Py2/Py3 Compatability Utilities
 # ###################################
@@ -852,6 +891,27 @@ def stackedImage(id_list, align=False, yflip=False,
                                   context=context, profile=profile, **kw)
 
 
+#######################################
+# Plot Worker Utilities
+#######################################
+
+def _plotWorkerInit():
+    '''Initialize a _plotSpecMany() worker process with a non-GUI backend.
+    '''
+    plt.switch_backend('Agg')
+
+
+def _plotWorker(spec, out):
+    '''Render a single spectrum to a file, in a worker process or in this
+       one when no pool is available.
+    '''
+    spec = dict(spec)
+    specClient._plotSpec(spec.pop('wavelength'), spec.pop('flux'),
+                         out=out, **spec)
+    plt.close()
+    return out
+
+
 #######################################
 # Spectroscopic Data Client Class
 #######################################
@@ -875,8 +935,16 @@ class specClient(object):
 
         self.hostip = THIS_IP
         self.hostname = THIS_HOST
+
+        # Invariant headers for form POSTs; only the auth token varies.
+        self._form_headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-DL-ClientVersion': __version__,
+            'X-DL-OriginIP': self.hostip,
+            'X-DL-OriginHost': self.hostname}
         self.debug = DEBUG                      # interface debug flag
         self.verbose = VERBOSE                  # interface verbose flag
+        self.session = _newSession()            # persistent HTTP session
 
         # Get the server-side config for the context.  Note this must also
         # be updated whenever we do a set_svc_url() or set_context().
@@ -1049,7 +1117,7 @@ class specClient(object):
         '''
         url = svc_url
         try:
-            r = requests.get(url, timeout=2)
+            r = self.session.get(url, timeout=2)
             resp = r.text
 
             if r.status_code != 200:
@@ -1087,7 +1155,7 @@ class specClient(object):
         svc_url += "profile=%s&" % profile
         svc_url += "format=%s" % fmt
 
-        r = requests.get(svc_url, headers=headers)
+        r = self.session.get(svc_url, headers=headers)
         profiles = spcToString(r.content)
         if '{' in profiles:
             profiles = json.loads(profiles)
@@ -1117,7 +1185,7 @@ class specClient(object):
         svc_url += "context=%s&" % context
         svc_url += "format=%s" % fmt
 
-        r = requests.get(svc_url, headers=headers)
+        r = self.session.get(svc_url, headers=headers)
         contexts = spcToString(r.content)
         if '{' in contexts:
             contexts = json.loads(contexts)
@@ -1135,7 +1203,7 @@ class specClient(object):
         svc_url += "profile=%s&" % profile
         svc_url += "format=%s" % fmt
 
-        r = requests.get(svc_url, headers=headers)
+        r = self.session.get(svc_url, headers=headers)
         catalogs = spcToString(r.text)
         if '{' in catalogs:
             catalogs = json.loads(catalogs)
@@ -1378,7 +1446,7 @@ class specClient(object):
         _svc_url += 'profile=%s&' % profile             # service profile
         _svc_url += 'debug=%s&' % debug                 # system debug flag
         _svc_url += 'verbose=%s' % False           # system verbose flag
-        r = requests.get(_svc_url, headers=headers)
+        r = self.session.get(_svc_url, headers=headers)
         _res = spcToString(r.content)
 
         # Query result is in CSV, convert to a named table.
@@ -1485,11 +1553,7 @@ class specClient(object):
         debug = kw['debug'] if 'debug' in kw else self.debug
 
         # Set service call headers.
-        headers = {'Content-Type': 'application/x-www-form-urlencoded',
-                   'X-DL-ClientVersion': __version__,
-                   'X-DL-OriginIP': self.hostip,
-                   'X-DL-OriginHost': self.hostname,
-                   'X-DL-AuthToken': def_token(None)}
+        headers = {**self._form_headers, 'X-DL-AuthToken': def_token(None)}
 
         if debug:
             print('getSpec(): in ty id_list = ' + str(type(id_list)))
@@ -1520,7 +1584,7 @@ class specClient(object):
 
         # Get the limits of the collection
         url = '%s/listSpan' % self.svc_url
-        resp = requests.post(url, data=data, headers=headers)
+        resp = self.session.post(url, data=data, headers=headers)
         v = json.loads(resp.text)
         data['w0'], data['w1'] = v['w0'], v['w1']
 
@@ -1528,7 +1592,7 @@ class specClient(object):
         if align:
             # If we're aligning columns, the server will pad the values
             # and return a common array size.
-            resp = requests.post(url, data=data, headers=headers)
+            resp = self.session.post(url, data=data, headers=headers)
             _data = np.load(BytesIO(resp.content), allow_pickle=False)
         else:
             # If not aligning columns, request each spectrum individually
@@ -1536,7 +1600,7 @@ class specClient(object):
             _data = []
             for id in ids:
                 data['id_list'] = str(id)
-                resp = requests.post(url, data=data, headers=headers)
+                resp = self.session.post(url, data=data, headers=headers)
                 if fmt.lower() == 'fits':
                     _data.append(resp.content)
                 else:
@@ -1718,7 +1782,7 @@ class specClient(object):
                 _svc_url += "profile=%s&" % profile
                 _svc_url += "debug=%s&" % debug
                 _svc_url += "verbose=%s" % verbose
-                r = requests.get(_svc_url, headers=headers)
+                r = self.session.get(_svc_url, headers=headers)
                 if r.status_code == 200:
                     _val = spcToString(r.content).split('\n')[1:-1][0]
                     z = float(_val)
@@ -1853,7 +1917,8 @@ class specClient(object):
             if USE_CURL:
                 return Image.open(BytesIO(self.curl_get(url)))
             else:
-                return Image.open(BytesIO(requests.get(url, timeout=2).content))
+                resp = self.session.get(url, timeout=2)
+                return Image.open(BytesIO(resp.content))
         except Exception as e:
             raise Exception("Error getting plot data: " + str(e))
 
@@ -1926,31 +1991,23 @@ class specClient(object):
         fmt = kw['fmt'] if 'fmt' in kw else 'png'
 
         # Set service call headers.
-        headers = {'Content-Type': 'application/x-www-form-urlencoded',
-                   'X-DL-ClientVersion': __version__,
-                   'X-DL-OriginIP': self.hostip,
-                   'X-DL-OriginHost': self.hostname,
-                   'X-DL-AuthToken': token}
+        headers = {**self._form_headers, 'X-DL-AuthToken': token}
 
         # Build the query URL string.
         url = '%s/plotGrid' % self.svc_url
 
-        if isinstance(id_list, list) or isinstance(id_list, np.ndarray):
-            n_ids = len(id_list)
+        # Select the page of IDs.  Slicing an array gives a view which is
+        # serialized directly into the payload, a list slice copies only
+        # the page.
+        ids = id_list
+        if isinstance(id_list, (list, np.ndarray)):
             sz_grid = nx * ny
-            if sz_grid >= n_ids:         # Use the whole list.
-                ids = id_list
-                p_start = 0
-                p_end = len(id_list) - 1
-            else:
+            if sz_grid < len(id_list):
                 p_start = page * sz_grid
-                p_end = min(n_ids, p_start + sz_grid)
-                ids = id_list[p_start:p_end]
-        else:
-            ids = id_list
+                ids = id_list[p_start:p_start + sz_grid]
 
         # Initialize the payload.
-        data = {'id_list': str(list(ids)),
+        data = {'id_list': self.idListString(ids),
                 'ncols': ny,
                 'context': context,
                 'profile': profile,
@@ -1959,8 +2016,10 @@ class specClient(object):
               }
 
 
-        resp = requests.post(url, data=data, headers=headers)
+        resp = self.session.post(url, data=data, headers=headers)
         if fmt == 'png':
+            if resp.status_code != 200:
+                raise Exception(spcToString(resp.content))
             return Image.open(BytesIO(resp.content))
         else:
             return resp.content
@@ -2029,17 +2088,13 @@ class specClient(object):
         fmt = kw['fmt'] if 'fmt' in kw else 'png'
 
         # Set service call headers.
-        headers = {'Content-Type': 'application/x-www-form-urlencoded',
-                   'X-DL-ClientVersion': __version__,
-                   'X-DL-OriginIP': self.hostip,
-                   'X-DL-OriginHost': self.hostname,
-                   'X-DL-AuthToken': token}
+        headers = {**self._form_headers, 'X-DL-AuthToken': token}
 
         # Build the query URL string.
         url = '%s/stackedImage' % self.svc_url
 
         # Initialize the payload.
-        data = {'id_list': str(list(id_list)),
+        data = {'id_list': self.idListString(id_list),
                 'context': context,
                 'xscale': xscale,
                 'yscale': yscale,
@@ -2053,8 +2108,10 @@ class specClient(object):
                 'verbose': verbose
               }
 
-        resp = requests.post(url, data=data, headers=headers)
+        resp = self.session.post(url, data=data, headers=headers)
         if fmt == 'png':
+            if resp.status_code != 200:
+                raise Exception(spcToString(resp.content))
             return Image.open(BytesIO(resp.content))
         else:
             return resp.content
@@ -2111,7 +2168,7 @@ class specClient(object):
             * sky_args - Plotting kwargs for the sky.
         """
 
-        def labelLines(lines, ax, color, yloc):
+        def labelLines(lambdas, labels, ax, color, yloc):
             '''Select only those lines that are visible in
                the x-range of the plot.
             '''
@@ -2120,17 +2177,25 @@ class specClient(object):
                          'Redshift required to mark lines in observed frame')
                 return
 
-            for ii in range(len(lines)):
-                # If rest_frame=False, shift lines to the observed frame.
-                lam = lines[ii]['lambda']
-                if rest_frame is False:
-                    lam = lam * (1+z)
-                # Plot only lines within the x-range of the plot.
-                if ((lam > xbounds[0]) & (lam < xbounds[1])):
-                    ax.axvline(lam, color=color, lw=1.0, linestyle=':')
-                    ax.annotate(lines[ii]['label'], xy=(lam, yloc),
-                                xycoords=ax.get_xaxis_transform(),
-                                fontsize=12, rotation=90, color=color)
+            # If rest_frame=False, shift lines to the observed frame.
+            lams = lambdas * (1.0 if rest_frame is not False else (1+z))
+
+            # Plot only lines within the x-range of the plot.
+            mask = (lams > xbounds[0]) & (lams < xbounds[1])
+            xs = lams[mask]
+            xform = ax.get_xaxis_transform()
+
+            # Draw all the lines as one collection spanning the axes height.
+            # This is what ax.vlines() does, but older matplotlib versions
+            # autoscale the y-axis to the (0,1) axes coordinates.
+            segs = np.stack([np.column_stack([xs, np.zeros_like(xs)]),
+                             np.column_stack([xs, np.ones_like(xs)])], axis=1)
+            ax.add_collection(LineCollection(segs, transform=xform,
+                                             colors=color, linewidths=1.0,
+                                             linestyles=':'), autolim=False)
+            for lam, lbl in zip(xs, labels[mask]):
+                ax.annotate(lbl, xy=(lam, yloc), xycoords=xform,
+                            fontsize=12, rotation=90, color=color)
 
         # Process the optional kwargs.
         dark = kw['dark'] if 'dark' in kw else True
@@ -2157,61 +2222,66 @@ class specClient(object):
         else:
             ivar_args = {'color': 'blue', 'linewidth': 1.0}
 
-        # Setting up the plot
+        # Setting up the plot.  The axes colors are scoped to this figure
+        # rather than set globally in plt.rcParams.
         if dark:
-            fig = plt.figure(dpi=100, figsize=(12, 5), facecolor='#2F4F4F')
-            plt.rcParams['axes.facecolor'] = '#121212'
-            plt.rcParams['axes.edgecolor'] = '#00FFFF'
+            rc = {'axes.facecolor': '#121212', 'axes.edgecolor': '#00FFFF'}
         else:
-            fig = plt.figure(dpi=100, figsize=(12, 5))
-            plt.rcParams['axes.facecolor'] = '#FFFFFF'
+            rc = {'axes.facecolor': '#FFFFFF', 'axes.edgecolor': 'black'}
+        with plt.rc_context(rc):
+            if dark:
+                fig = plt.figure(dpi=100, figsize=(12, 5),
+                                 facecolor='#2F4F4F')
+            else:
+                fig = plt.figure(dpi=100, figsize=(12, 5))
+            ax = fig.add_subplot(111)
 
-        ax = fig.add_subplot(111)
+        # Compute the valid-pixel mask once and share it between the values.
+        mask = None if ivar is None else (ivar > 0)
         if 'flux' in values:
-            if ivar is None:
+            if mask is None:
                 ax.plot(wavelength, flux, label='Flux', **spec_args)
             else:
-                ax.plot(wavelength, flux * (ivar > 0), label='Flux',
-                        **spec_args)
+                ax.plot(wavelength, flux * mask, label='Flux', **spec_args)
         if 'model' in values and model is not None:
-            if ivar is None:
+            if mask is None:
                 ax.plot(wavelength, model, label='Model', **model_args)
             else:
-                ax.plot(wavelength, model * (ivar > 0), label='Model',
-                        **model_args)
+                ax.plot(wavelength, model * mask, label='Model', **model_args)
         if 'sky' in values and sky is not None and ivar is not None:
-            if ivar is None:
+            if mask is None:
                 ax.plot(wavelength, sky, label='Sky', **model_args)
             else:
-                ax.plot(wavelength, sky * (ivar > 0), label='Sky', **sky_args)
+                ax.plot(wavelength, sky * mask, label='Sky', **sky_args)
         if 'ivar' in values and ivar is not None:
-            ax.plot(wavelength, ivar * (ivar > 0), label='Ivar', **ivar_args)
+            ax.plot(wavelength, ivar * mask, label='Ivar', **ivar_args)
 
-        plt.xlim(xlim)
-        plt.ylim(ylim)
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
         am_color = ('#00FF00' if dark else 'black')
         if ylabel is None:
             if rest_frame:
-                plt.xlabel('Rest Wavelength ($\AA$)', color=am_color)
+                ax.set_xlabel('Rest Wavelength ($\AA$)', color=am_color)
             else:
                 if z is not None:
-                    plt.xlabel('Observed Wavelength ($\AA$)    z=%.3g' % z,
-                               color=am_color)
+                    ax.set_xlabel('Observed Wavelength ($\AA$)    z=%.3g' % z,
+                                  color=am_color)
                 else:
-                    plt.xlabel('Observed Wavelength ($\AA$)    z=(unknown)',
-                               color=am_color)
+                    ax.set_xlabel(
+                        'Observed Wavelength ($\AA$)    z=(unknown)',
+                        color=am_color)
         else:
-            plt.xlabel(xlabel, color=am_color)
+            ax.set_xlabel(xlabel, color=am_color)
         if ylabel is None:
             ylab = '$F_{\lambda}$ ($10^{-17}~ergs~s^{-1}~cm^{-2}~\AA^{-1}$)'
-            plt.ylabel(ylab, color=am_color)
+            ax.set_ylabel(ylab, color=am_color)
         else:
-            plt.ylabel(ylabel, color=am_color)
+            ax.set_ylabel(ylabel, color=am_color)
 
         if dark:
             ax.tick_params(color='cyan', labelcolor='yellow')
         if grid:
-            plt.grid(color='gray', linestyle='dashdot', linewidth=0.5)
+            ax.grid(color='gray', linestyle='dashdot', linewidth=0.5)
 
         if title not in [None, '']:
             ax.set_title(title, c=am_color)
@@ -2225,21 +2295,25 @@ class specClient(object):
                 opt = mark_lines.lower()
 
             # Select any lines listed by the user.
-            e_lines = _em_lines
+            e_lams, e_labels = _em_lambdas, _em_labels
             if em_lines is not None:
-                e_lines = list(filter(lambda x: x['name'] in em_lines,
-                               _em_lines))
-            a_lines = _abs_lines
+                em_set = frozenset(em_lines)
+                idx = np.fromiter((i for n, i in _em_names.items()
+                                   if n in em_set), int)
+                e_lams, e_labels = _em_lambdas[idx], _em_labels[idx]
+            a_lams, a_labels = _abs_lambdas, _abs_labels
             if abs_lines is not None:
-                a_lines = list(filter(lambda x: x['name'] in abs_lines,
-                               _abs_lines))
+                abs_set = frozenset(abs_lines)
+                idx = np.fromiter((i for n, i in _abs_names.items()
+                                   if n in abs_set), int)
+                a_lams, a_labels = _abs_lambdas[idx], _abs_labels[idx]
             xbounds = ax.get_xbound()   # Getting the x-range of the plot
 
             lcol = ['#FFFF00', '#00FFFF'] if dark else ['#FF0000', '#0000FF']
             if 'e' in opt:
-                labelLines(e_lines, ax, lcol[0], 0.875)
+                labelLines(e_lams, e_labels, ax, lcol[0], 0.875)
             if 'a' in opt:
-                labelLines(a_lines, ax, lcol[1], 0.05)
+                labelLines(a_lams, a_labels, ax, lcol[1], 0.05)
 
         leg = ax.legend()
         if dark:
@@ -2251,6 +2325,47 @@ class specClient(object):
         else:
             plt.show()
 
+    # --------------------------------------------------------------------
+    # _PLOTSPECMANY -- Render a list of spectra to files in parallel.
+    #
+    @staticmethod
+    def _plotSpecMany(specs, out_dir, n_workers=None):
+        """Render a list of spectra to PNG files using a pool of worker
+           processes.
+
+        Inputs:
+            * specs - List of dicts of _plotSpec() arguments.  Each must
+                      contain at least the 'wavelength' and 'flux' arrays.
+            * out_dir - Directory in which to write '<index>.png' files.
+            * n_workers - Number of worker processes (def: number of CPUs)
+
+        Returns:
+            List of the output filenames, in the order of 'specs'.
+
+        If the specs can't be sent to a worker or the workers can't be
+        started (e.g. from an interactive __main__), the spectra are
+        rendered in this process instead.
+        """
+        outs = [os.path.join(out_dir, '%d.png' % i) for i in range(len(specs))]
+        try:
+            pickle.dumps((_plotWorker, specs))
+            pool = ProcessPoolExecutor(max_workers=n_workers,
+                                       initializer=_plotWorkerInit)
+        except Exception:
+            pool = None
+
+        if pool is not None:
+            try:
+                with pool:
+                    list(pool.map(_plotWorker, specs, outs))
+                return outs
+            except (BrokenProcessPool, OSError):
+                pass
+
+        for spec, out in zip(specs, outs):
+            _plotWorker(spec, out)
+        return outs
+
     ###################################################
     #  PRIVATE UTILITY METHODS
     ###################################################
@@ -2268,9 +2383,9 @@ class specClient(object):
             # Add the auth token to the reauest header.
             if self.auth_token != None:
                 headers = {'X-DL-AuthToken': self.auth_token}
-                r = requests.get(url, headers=headers)
+                r = self.session.get(url, headers=headers)
             else:
-                r = requests.get(url)
+                r = self.session.get(url)
             response = spcToString(r.content)
 
             if r.status_code != 200:
@@ -2284,37 +2399,25 @@ class specClient(object):
     def getHeaders(self, token):
         '''Get default tracking headers.
         '''
-        tok = def_token(token)
-        user, uid, gid, hash = tok.strip().split('.', 3)
-        hdrs = {'Content-Type': 'text/ascii',
-                'X-DL-ClientVersion': __version__,
-                'X-DL-OriginIP': self.hostip,
-                'X-DL-OriginHost': self.hostname,
-                'X-DL-User': user,
-                'X-DL-AuthToken': tok}
-        return hdrs
+        return dict(_tokenHeaders(def_token(token), self.hostip,
+                                  self.hostname))
 
     def getFromURL(self, svc_url, path, token):
         '''Get something from a URL.  Return a 'response' object.
         '''
         try:
             hdrs = self.getHeaders(token)
-            resp = requests.get("%s%s" % (svc_url, path), headers=hdrs)
+            resp = self.session.get("%s%s" % (svc_url, path), headers=hdrs)
 
         except Exception as e:
             raise dlSpecError(str(e))
         return resp
 
     def curl_get(self, url):
-        '''Utility routine to use cURL to return a URL
+        '''Utility routine to return the content of a URL.  This reuses the
+           client session rather than opening a new connection for each call.
         '''
-        b_obj = BytesIO()
-        crl = pycurl.Curl()
-        crl.setopt(crl.URL, url)
-        crl.setopt(crl.WRITEDATA, b_obj)
-        crl.perform()
-        crl.close()
-        return b_obj.getvalue()
+        return self.session.get(url).content
 
     def extractIDList(self, id_list, id_col=None):
         '''Extract a 1-D array or single identifier from an input ID type.
@@ -2342,16 +2445,16 @@ class specClient(object):
 
             el = ids[0]
             if isinstance(el, str):
-                cnv_list = []
+                ids = np.asarray(ids)
+                ids = ids[ids != '']
                 if el[0] == '(':      # Assume a tuple
-                    for el in ids:
-                        if el != '':
-                            cnv_list.append(el[1:-1])
+                    ids = np.char.strip(ids, '()')
                 else:
-                    for el in ids:
-                        if el != '':
-                            cnv_list.append(int(el))
-                ids = np.array(cnv_list)
+                    try:
+                        ids = ids.astype(np.int64)
+                    except OverflowError:
+                        # SDSS specobjids can exceed the int64 range.
+                        ids = ids.astype(np.uint64)
 
         elif isinstance(id_list, int) or \
              isinstance(id_list, np.int64) or \
@@ -2393,6 +2496,22 @@ class specClient(object):
 
         return ids
 
+    def idListString(self, ids):
+        '''Format an ID list as the '[id1, id2, ...]' string expected in the
+           service payload without first copying it to a Python list.
+        '''
+        if isinstance(ids, np.ndarray):
+            if orjson is not None and ids.ndim == 1 and \
+               np.issubdtype(ids.dtype, np.integer):
+                # orjson writes '[1,2]', keep the '[1, 2]' list spacing.
+                return orjson.dumps(np.ascontiguousarray(ids),
+                                    option=orjson.OPT_SERIALIZE_NUMPY
+                                   ).decode().replace(',', ', ')
+            return str(ids.tolist())
+        elif isinstance(ids, list):
+            return str(ids)
+        return str(list(ids))
+
 
 # ###################################
 #  Spectroscopic Data Client Handles
@@ -2501,16 +2620,40 @@ _abs_lines = [
     {"name": "H-alpha",        "lambda": 6564.614, "label": "H$\\alpha$"}
 ]
 
+# Precomputed wavelength/label arrays and name->index maps used to select
+# and mark the visible lines in _plotSpec().
+_em_lambdas = np.array([l['lambda'] for l in _em_lines])
+_em_labels = np.array([l['label'] for l in _em_lines])
+_em_names = {l['name']: i for i, l in enumerate(_em_lines)}
 
-def airtovac(l):
+_abs_lambdas = np.array([l['lambda'] for l in _abs_lines])
+_abs_labels = np.array([l['label'] for l in _abs_lines])
+_abs_names = {l['name']: i for i, l in enumerate(_abs_lines)}
+
+
+def _airtovac(l):
     '''Convert air wavelengths (greater than 2000A) to vacuum wavelengths.
+       Accepts either a scalar or an array of wavelengths.
     '''
-    if l < 2000.0:
-        return l
-    vac = l
+    l = np.asarray(l, dtype=float)
+    vac = l.copy()
     for iter in range(2):
         sigma2 = (1.0e4 / vac) * (1.0e4 / vac)
         fact = 1.0 + 5.792105e-2 / (238.0185 - sigma2) + \
             1.67917e-3 / (57.362 - sigma2)
         vac = l * fact
-    return vac
+    vac = np.where(l < 2000.0, l, vac)
+    return vac if vac.ndim else float(vac)
+
+
+# Vacuum wavelengths of the (static) line tables, computed once at import.
+_vac_cache = {l['lambda']: _airtovac(l['lambda'])
+              for l in _em_lines + _abs_lines}
+
+
+def airtovac(l):
+    '''Convert air wavelengths (greater than 2000A) to vacuum wavelengths.
+    '''
+    if np.ndim(l) == 0 and l in _vac_cache:
+        return _vac_cache[l]
+    return _airtovac(l)
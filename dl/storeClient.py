@@ -21,6 +21,9 @@ Storage Manager Client Interface
             get_svc_url  ()
             set_profile  (profile=DEF_SERVICE_PROFILE)
             get_profile  ()
+            clear_cache  ()
+        set_max_workers  (nworkers=DEF_MAX_WORKERS)
+        get_max_workers  ()
                services  (name=None, svc_type='vos', format=None,
                           profile='default')
 
@@ -87,14 +90,29 @@ Import via
 '''
 
 import os
+import posixpath
 import sys
 import fnmatch
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import glob
+import io
+import shutil
 import socket
 import json
 import time
 import re
+import base64
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson                               # fast JSON decoder
+except ImportError:
+    orjson = None
 
 if os.path.isfile('./Util.py'):                # use local dev copy
     from Util import multimethod
@@ -122,13 +140,16 @@ DEF_SERVICE_ROOT = 'https://datalab.noirlab.edu'
 
 # Allow the service URL for dev/test systems to override the default.
 THIS_HOST = socket.gethostname()                        # host name
-sock = socket.socket(type=socket.SOCK_DGRAM)  	# host IP address
-sock.connect(('8.8.8.8', 1))  	# Example IP address, see RFC 5737
-THIS_IP, _ = sock.getsockname()
+try:
+    with socket.socket(type=socket.SOCK_DGRAM) as sock:	# host IP address
+        sock.connect(('8.8.8.8', 1))  	# Example IP address, see RFC 5737
+        THIS_IP, _ = sock.getsockname()
+except OSError:
+    THIS_IP = '127.0.0.1'                               # no network route
 
-if THIS_HOST[:5] == 'dldev':
+if THIS_HOST.startswith('dldev'):
     DEF_SERVICE_ROOT = 'https://dldev.datalab.noirlab.edu'
-elif THIS_HOST[:6] == 'dltest':
+elif THIS_HOST.startswith('dltest'):
     DEF_SERVICE_ROOT = 'https://dltest.datalab.noirlab.edu'
 
 DEF_SERVICE_URL = DEF_SERVICE_ROOT + '/storage'
@@ -138,6 +159,30 @@ QM_SERVICE_URL = DEF_SERVICE_ROOT + '/query'
 # machines and services used by the Storage Manager on the server.
 DEF_SERVICE_PROFILE     = 'default'
 
+# Maximum number of concurrent transfers for multi-file requests.
+DEF_MAX_WORKERS         = 8
+
+# Number of pooled HTTP connections kept per host.
+DEF_POOL_SIZE           = 32
+
+# Connect and read timeouts (sec) for service calls.
+DEF_TIMEOUT             = (5, 60)
+
+# Connect and read timeouts (sec) for service operations (cp, mv, load,
+# uploads ...) which may run for a long time on the server.  A read
+# timeout of None waits for the reply.
+DEF_OP_TIMEOUT          = (5, None)
+
+# Read size (bytes) for streamed file downloads.
+DL_CHUNK_SIZE           = 1024 * 1024
+
+# Minimum time (sec) between progress redraws when the size is unknown.
+DL_PROGRESS_INTERVAL    = 0.2
+
+# Lifetime (sec) of cached stat/access/ls results.  A value of zero
+# disables the cache.
+DEF_CACHE_TTL           = 5.0
+
 # Use a /tmp/SM_DEBUG file as a way to turn on debugging in the client code.
 DEBUG           = os.path.isfile('/tmp/SM_DEBUG')
 
@@ -152,12 +197,17 @@ if os.path.exists('/tmp/QM_SVC_URL'):
 
 URI_RESERVED = ":;?/@&=+$,"          # RFC2396 reserved URI chars
 
+# Top-level nodes that rm() and rmdir() may not remove.
+_PROTECTED = frozenset(('vos://', 'vos://tmp', 'vos://public'))
+
 # DLC-1818. There are file names we served, that contain + signs
 # in their names. They need to be escaped for it to work on a URL.
 # For now we are only escaping the +/plus sign to minimize introducing
 # unwanted behaviours.
 # A deeper look at what characters are allowed system wide should be done at
 # some point.
+# Query values are now passed to requests as 'params', which escapes the
+# plus sign along with every other reserved character.
 PLUS_REGEX = r'\+'
 PLUS_URL_ESC_CODE = "%2B"
 
@@ -208,6 +258,24 @@ def set_profile(profile=DEF_SERVICE_PROFILE):
 def get_profile():
     return sc_client.get_profile()
 
+# --------------------------------------------------------------------
+# CLEAR_CACHE -- Discard cached stat/access/ls results.
+#
+def clear_cache():
+    return sc_client.clear_cache()
+
+# --------------------------------------------------------------------
+# SET_MAX_WORKERS -- Set the number of concurrent multi-file transfers.
+#
+def set_max_workers(nworkers=DEF_MAX_WORKERS):
+    return sc_client.set_max_workers(nworkers=nworkers)
+
+# --------------------------------------------------------------------
+# GET_MAX_WORKERS -- Get the number of concurrent multi-file transfers.
+#
+def get_max_workers():
+    return sc_client.get_max_workers()
+
 # --------------------------------------------------------------------
 # SERVICES -- List public storage services
 #
@@ -303,8 +371,10 @@ def access(path, mode=None, token=None, verbose=True):
 
     Parameters
     ----------
-    path : str
-        A name or file template of the file status to retrieve.
+    path : str or list
+        A name or file template of the file status to retrieve.  If a
+        list of names is given, the requests are made concurrently and a
+        list of results is returned.
 
     mode : str
         Requested access mode.  Modes are 'r' (read access), 'w' (write
@@ -357,8 +427,10 @@ def stat(path, token=None, verbose=True):
 
     Parameters
     ----------
-    path : str
-        A name or file template of the file status to retrieve.
+    path : str or list
+        A name or file template of the file status to retrieve.  If a
+        list of names is given, the requests are made concurrently and a
+        list of results is returned.
 
     token : str [Optional]
         Authentication token (see function :func:`authClient.login()`).
@@ -477,11 +549,10 @@ def get(token=None, fr='', to='', mode='text', verbose=True, debug=False,
         Print debug output.
 
     timeout : integer
-        Retry timeout value.  When processing long lists, download will
-        pause every ``timeout`` files to lessen server load.  For individual
-        files, transfer will retry for ``timeout`` seconds before aborting.
-        Failed transfers are automatically appended to the file list so
-        they may be transferred again later.
+        Retry timeout value.  For individual files, transfer will retry for
+        ``timeout`` seconds before aborting.  Multiple files are downloaded
+        concurrently (see ``storeClient.max_workers``); failed transfers are
+        retried once after the rest of the list has been transferred.
 
     Returns
     -------
@@ -696,7 +767,7 @@ def ls(token, name, format='csv', verbose=False):
 
 @multimethod('sc',1,False)
 def ls(optval, name='vos://', token=None, format='csv', verbose=False):
-    if optval is not None and is_auth_token(optval):
+    if isinstance(optval, str) and is_auth_token(optval):
         # optval looks like a token
         return sc_client._ls(name=name, format=format,
                           token=def_token(optval), verbose=verbose)
@@ -723,9 +794,11 @@ def ls(name='vos://', token=None, format='csv', verbose=False):
     token : str [Optional]
         Authentication token (see function :func:`authClient.login()`).
 
-    name : str [Optional]
+    name : str or list [Optional]
         Valid name of file or directory, e.g. ``vos://somedir``. If no name
-        is provided, it will return the top directory listing.
+        is provided, it will return the top directory listing.  If a list
+        of names is given, the listings are retrieved concurrently and a
+        list of results is returned.
 
     format : str
         Default ``csv``.  The ``long`` option produces an output similar to ``ls -l``.
@@ -865,7 +938,7 @@ def rm(token, name, verbose=False):
 
 @multimethod('sc',1,False)
 def rm(optval, name='', token=None, verbose=False):
-    if optval is not None and is_auth_token(optval):
+    if isinstance(optval, str) and is_auth_token(optval):
         # optval looks like a token
         return sc_client._rm(name=name, token=def_token(optval),
                              verbose=verbose)
@@ -892,8 +965,9 @@ def rm(name='', token=None, verbose=False):
     token : str [Optional]
         Authentication token (see function :func:`authClient.login()`).
 
-    name : str
-        Name of the file to delete.
+    name : str or list
+        Name of the file to delete.  If a list of names is given, the
+        files are deleted concurrently and a list of results is returned.
 
     Returns
     -------
@@ -1158,6 +1232,54 @@ def pull(name, endpoint, token=None, is_vospace=False):
 
 
 
+# ####################################################################
+#  Client Cache Utilities
+# ####################################################################
+
+def _modifies(func):
+    '''Decorator for client methods that modify the store.  Cached
+       stat/access/ls results are discarded when the method returns.
+    '''
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+    return wrapper
+
+
+# ####################################################################
+#  HTTP Session Utilities
+# ####################################################################
+
+def _newSession(retry=False, pool_size=DEF_POOL_SIZE):
+    '''Create a persistent HTTP session for service calls.  Connections
+       are pooled and kept alive between calls.  If ``retry`` is set,
+       requests are retried on connection errors and gateway failures,
+       so it may only be used for requests that are safe to repeat.
+    '''
+    session = requests.Session()
+    _mountAdapter(session, retry=retry, pool_size=pool_size)
+    return session
+
+
+def _mountAdapter(session, retry=False, pool_size=DEF_POOL_SIZE):
+    '''Mount a new connection pool adapter on the ``session``.
+    '''
+    if retry:
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(502, 503, 504),
+                      allowed_methods=frozenset(['GET', 'HEAD']),
+                      raise_on_status=False)
+    else:
+        retry = 0
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+
 # ####################################################################
 #  Module Functions
 # ####################################################################
@@ -1177,6 +1299,23 @@ class storeClient(object):
         self.hostip = THIS_IP
         self.hostname = THIS_HOST
         self.async_wait = False
+        self.max_workers = DEF_MAX_WORKERS      # concurrent transfer limit
+        self._pool_size = DEF_POOL_SIZE         # connections per host
+        self.timeout = DEF_TIMEOUT              # service call timeouts
+        self.op_timeout = DEF_OP_TIMEOUT        # service operation timeouts
+        # Service operations such as cp, mv or rm are sent as GETs but
+        # must never be repeated, so they use a session without retries.
+        # Only the idempotent reads (stat, access, ls, isdir and the file
+        # downloads) use the retrying session.
+        self.session = _newSession()            # persistent HTTP session
+        self._fetch = _newSession(retry=True)   # retrying read session
+        for sess in (self.session, self._fetch):
+            sess.headers.update({'X-DL-ClientVersion': __version__,
+                                 'X-DL-OriginIP': self.hostip,
+                                 'X-DL-OriginHost': self.hostname})
+        self._auth_hdrs = (None, None)          # last token's headers
+        self.cache_ttl = DEF_CACHE_TTL          # stat/access/ls cache TTL
+        self._cache = {}
 
         # Get the $HOME/.datalab directory.
         self.home = '%s/.datalab' % os.path.expanduser('~')
@@ -1217,11 +1356,10 @@ class storeClient(object):
             svc_url = self.svc_url
 
         try:
-            r = requests.get(svc_url.strip('/'), timeout=timeout)
-            resp = scToString(r.content)
+            r = self.session.get(svc_url.strip('/'), timeout=timeout)
             if r.status_code != requests.codes.ok:
                 return False
-            elif resp is not None and r.text.lower()[:11] != "hello world":
+            elif r.content[:11].lower() != b"hello world":
                 return False
         except Exception:
             return False
@@ -1312,6 +1450,115 @@ class storeClient(object):
         '''
         return scToString(self.svc_profile)
 
+    def set_max_workers(self, nworkers=DEF_MAX_WORKERS):
+        '''Set the maximum number of files transferred concurrently by a
+           multi-file ``get()`` or ``put()``.  Larger values help most when
+           moving many small files.
+
+        Parameters
+        ----------
+        nworkers : int
+            The number of concurrent transfers, at least 1.
+
+        Returns
+        -------
+        Nothing
+
+        Example
+        -------
+        .. code-block:: python
+
+            storeClient.set_max_workers(32)
+        '''
+        self.max_workers = max(1, int(nworkers))
+        if self.max_workers > self._pool_size:
+            # Grow the connection pool so every worker keeps its connection.
+            self._pool_size = self.max_workers
+            _mountAdapter(self.session, pool_size=self._pool_size)
+            _mountAdapter(self._fetch, retry=True, pool_size=self._pool_size)
+
+    def get_max_workers(self):
+        '''Get the maximum number of files transferred concurrently.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        nworkers : int
+            The number of concurrent transfers.
+
+        Example
+        -------
+        .. code-block:: python
+
+            print(storeClient.get_max_workers())
+        '''
+        return self.max_workers
+
+    def clear_cache(self):
+        '''Discard cached ``stat()``, ``access()`` and ``ls()`` results.
+           Results are cached for ``cache_ttl`` seconds and are discarded
+           automatically by calls that modify the store, this is only
+           needed when files are changed by another client.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing
+
+        Example
+        -------
+        .. code-block:: python
+
+            storeClient.clear_cache()
+        '''
+        self._cache.clear()
+
+    def close(self):
+        '''Close the pooled connections held by the client.  The client
+           may still be used afterwards, new connections are opened as
+           they're needed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing
+
+        Example
+        -------
+        .. code-block:: python
+
+            sc = storeClient.getClient()
+            ...
+            sc.close()
+        '''
+        self.session.close()
+        self._fetch.close()
+
+    def _cached(self, key, func):
+        '''Return the cached result for ``key`` if it is younger than
+           ``cache_ttl`` seconds, otherwise call ``func`` and cache its
+           result.
+        '''
+        if self.cache_ttl <= 0:
+            return func()
+        ent = self._cache.get(key)
+        if ent is not None and time.monotonic() - ent[0] < self.cache_ttl:
+            return ent[1]
+        val = func()
+        if len(self._cache) >= 1024:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic(), val)
+        return val
+
 
     @multimethod('_sc',1,True)
     def list_profiles(self, token, profile=None, format='text'):
@@ -1330,17 +1577,16 @@ class storeClient(object):
     def _list_profiles(self, token=None, profile=None, format='text'):
         '''Implementation of the ``list_profiles()`` method.
         '''
-        dburl = '/profiles?'
+        params = {'format': format}
         if profile != None and profile != 'None' and profile != '':
-            dburl += "profile=%s&" % profile
-        dburl += "format=%s" % format
+            params['profile'] = profile
 
-        r = self.getFromURL(self.svc_url, dburl, def_token(token))
-        profiles = scToString(r.content)
-        if '{' in profiles:
-            profiles = json.loads(profiles)
+        r = self.getFromURL(self.svc_url, '/profiles', def_token(token),
+                            params=params, fetch=True)
+        if _isJSON(r):
+            return _jsonLoads(r.content)
 
-        return scToString(profiles)
+        return scToString(r.content)
 
 
     # --------------------------------------------------------------------
@@ -1355,22 +1601,22 @@ class storeClient(object):
                    profile='default'):
         '''
         '''
-        dburl = '/services?'
+        params = {}
         if profile is not None and profile != 'None' and profile != '':
-            dburl += ("profile=%s" % profile)
+            params['profile'] = profile
         if name is not None and name != 'None' and name != '':
-            dburl += ("&name=%s" % name.replace('%','%25'))
+            params['name'] = name
         if svc_type is not None and svc_type != 'None' and svc_type != '':
-            dburl += ("&type=%s" % svc_type)
+            params['type'] = svc_type
         if format is not None and format != 'None' and format != '':
-            dburl += "&format=%s" % format
+            params['format'] = format
 
-        r = self.getFromURL(self.qm_svc_url, dburl, def_token(None))
-        svcs = scToString(r.content)
-        if '{' in svcs:
-            svcs = json.loads(svcs)
+        r = self.getFromURL(self.qm_svc_url, '/services', def_token(None),
+                            params=params, fetch=True)
+        if _isJSON(r):
+            return _jsonLoads(r.content)
 
-        return scToString(svcs)
+        return scToString(r.content)
 
 
     # -----------------------------
@@ -1404,16 +1650,25 @@ class storeClient(object):
     def _access(self, path='', mode='', token=None, verbose=True):
         '''Implementation of the ``access()`` method.
         '''
-        uri = (path if path.count('://') > 0 else 'vos://' + path)
-        url = self.svc_url + ("/access?name=%s&mode=%s&verbose=%s" % \
-                         (uri,mode,verbose))
-        r = requests.get(url, headers={'X-DL-AuthToken': def_token(token)})
-        if r.status_code != requests.codes.ok:
-            return False
-        else:
-            val = scToString(r.content).lower()
-            return (True if val == 'true' else False)
-        pass
+        if isinstance(path, (list, tuple)):
+            return self._pmap(lambda p: self._access(path=p, mode=mode,
+                                  token=token, verbose=verbose), path)
+
+        def _access1():
+            uri = (path if '://' in path else 'vos://' + path)
+            # requests drops None values, the service expects 'mode=None'.
+            r = self._fetch.get(self.svc_url + "/access",
+                                params={'name': uri, 'mode': str(mode),
+                                        'verbose': verbose},
+                                headers={'X-DL-AuthToken': def_token(token)},
+                                timeout=self.timeout)
+            if r.status_code != requests.codes.ok:
+                return False
+            else:
+                val = scToString(r.content).lower()
+                return (True if val == 'true' else False)
+
+        return self._cached(('access', path, mode, token, verbose), _access1)
 
 
     # --------------------------------------------------------------------
@@ -1435,14 +1690,23 @@ class storeClient(object):
     def _stat(self, path='', token=None, verbose=True):
         '''Implementation of the ``stat()`` method.
         '''
+        if isinstance(path, (list, tuple)):
+            return self._pmap(lambda p: self._stat(path=p, token=token,
+                                  verbose=verbose), path)
 
-        uri = (path if path.count('://') > 0 else 'vos://' + path)
-        url = self.svc_url + ("/stat?name=%s&verbose=%s" % (uri,verbose))
-        r = requests.get(url, headers={'X-DL-AuthToken': def_token(token)})
-        if r.status_code != requests.codes.ok:
-            return {}
-        else:
-            return json.loads(scToString(r.content))
+        def _stat1():
+            uri = (path if '://' in path else 'vos://' + path)
+            r = self._fetch.get(self.svc_url + "/stat",
+                                params={'name': uri, 'verbose': verbose},
+                                headers={'X-DL-AuthToken': def_token(token)},
+                                timeout=self.timeout)
+            if r.status_code != requests.codes.ok:
+                return {}
+            else:
+                return _jsonLoads(r.content)
+
+        # Return a copy so callers can't modify the cached value.
+        return dict(self._cached(('stat', path, token, verbose), _stat1))
 
 
     # --------------------------------------------------------------------
@@ -1503,29 +1767,11 @@ class storeClient(object):
         '''Implementation of the ``get()`` method.
         '''
 
-        def sizeof_fmt(num):
-            '''Local pretty-printer for file sizes.
-            '''
-            for unit in ['B','K','M','G','T','P','E','Z']:
-                if abs(num) < 1024.0:
-                    if unit == 'B':
-                        return "%5d%s" % (num, unit)
-                    else:
-                        return "%3.1f%s" % (num, unit)
-                num /= 1024.0
-            return "%.1f%s" % (num, 'Y')
-
         tok = def_token(token)
-        user, uid, gid, hash = split_auth_token(tok.strip())
-        hdrs = {'Content-Type': 'text/ascii',
-                'X-DL-ClientVersion': __version__,
-                'X-DL-OriginIP': self.hostip,
-                'X-DL-OriginHost': self.hostname,
-                'X-DL-User': user,
-                'X-DL-AuthToken': tok}                  # application/x-sql
+        hdrs = self._authHeaders(tok)
 
         # Patch the names with the default URI prefix if needed.
-        nm = (fr if fr.count("://") > 0 else ("vos://" + fr))
+        nm = (fr if "://" in fr else ("vos://" + fr))
         nm = nm.replace('///','//')
 
         if debug:
@@ -1542,7 +1788,7 @@ class storeClient(object):
             # Expand metacharacters to create a file list for download.
             try:
                 flist = expandFileList(self.svc_url, token, nm, "csv",
-                                       full=True)
+                                       full=True, client=self)
             except Exception as e:
                 return str(e)
 
@@ -1553,106 +1799,68 @@ class storeClient(object):
             if debug:
                 print("get: flist = %s" % flist)
                 print("get: nfiles = %s" % nfiles)
-            fnum = 1
-            resp = []
-            for f in flist:
-                nfiles = len(flist)     # recompute in case list was modified
-
-                # Generate the download file path.
-                junk, fn = os.path.split(f)
-                if to.endswith("/"):
-                    dlname = ((to + fn) if hasmeta(fr) else to)
-                else:
-                    dlname = ((to + "/" + fn) if hasmeta(fr) else to)
-
-                # Get a single file.
-                res = requests.get(self.svc_url + "/get?name=%s" % re.sub(PLUS_REGEX, PLUS_URL_ESC_CODE, f),
-                                   headers=hdrs)
 
-                if res.status_code != 200:
-                    resp.append("Error: " + scToString(res.text))
-                else:
-                    r = None
-                    for i in range(1,timeout):
-                        try:
-                            r = requests.get(res.text, stream=True)
-                        except Exception as e:
-                            if "No connection adapters" in str(e) and i%5 == 0:
-                                print('GET error %d: retrying' % i)
-                            if "Internal Server Error" in str(e) and i%5 == 0:
-                                print('GET internal error %d: retrying' % i)
-                            time.sleep(1)
-                            if i == (timeout-1):
-                                r = None
-                                break
-                        else:
-                            break
-
-                    if r is None:
-                        # If the download failed, put it back at the end
-                        # of the list so we can retry later.
-                        flist.append(f)
-                    elif r.status_code != 200:
-                        resp.append(scToString(r.content))
-                    else:
-                        clen = r.headers.get('content-length')
-                        total_length = (0 if clen is None else int(clen))
-
-                        # Download the file in chunks so we can have a progress
-                        # indicator on each.
-                        dl = 0
-                        done = 0
-                        with open(dlname, 'wb', 0) as fd:
-
-                            while 1:
-                                buf = r.raw.read((8*1024))
-                                dl += len(buf)
-                                if not buf:
-                                    break
-                                fd.write(buf)
-                                if total_length > 0:
-                                    done = int(20 * dl / total_length)
-                                if verbose:     # Print a progress indicator
-                                    sys.stdout.write(
-                                        "\r(%d/%d) [%s%s] [%7s] %s" % \
-                                        (fnum, nfiles, '='*done, ' '*(20-done),
-                                        sizeof_fmt(dl), f[6:]))
-                                    sys.stdout.flush()
-
-                            # If the download failed, put it back at the end
-                            # of the list so we can retry later.
-                            if total_length > 0 and dl == 0:
-                                flist.append(f)
-
-                            # Handle a zero-length file download.
-                            if verbose:
-                                if dl == 0:
-                                    print("\r(%d/%d) [%s] [%7s] %s" % \
-                                        (fnum, nfiles, '=' * 20, "0 B", f[6:]))
-                                else:
-                                    print('')
-                        fd.close()
-                        resp.append('OK')
-                fnum += 1
-                if fnum % timeout == 0:
-                    time.sleep(5)
+            # Generate the download file paths.
+            if not hasmeta(fr):
+                dlnames = [to] * nfiles
+            else:
+                dldir = (to if to.endswith("/") else to + "/")
+                dlnames = [dldir + posixpath.basename(f) for f in flist]
+
+            # Transfer the files concurrently.  A progress bar is only
+            # printed when files are transferred one at a time, otherwise
+            # a status line is printed as each file completes.  Failed
+            # transfers are retried once after the rest of the list.
+            nworkers = max(1, min(self.max_workers, nfiles))
+            progress = (verbose and nworkers == 1)
+            resp = [None] * nfiles
+            pending = list(range(nfiles))
+            ndone = 0
+            for npass in range(2):
+                if not pending:
+                    break
+                with ThreadPoolExecutor(max_workers=nworkers) as ex:
+                    futures = {}
+                    for i in pending:
+                        prefix = ("(%d/%d)" % (i+1, nfiles) if progress else None)
+                        futures[ex.submit(self._getFile, flist[i], dlnames[i],
+                                          hdrs, timeout, prefix)] = i
+                    pending = []
+                    for fut in as_completed(futures):
+                        i = futures[fut]
+                        status = fut.result()
+                        if status is None:
+                            pending.append(i)       # retry later
+                            continue
+                        resp[i] = status
+                        ndone += 1
+                        if verbose and not progress:
+                            size = (sizeof_fmt(os.path.getsize(dlnames[i]))
+                                    if status == 'OK' else 'Error')
+                            print("(%d/%d) [%7s] %s" % (ndone, nfiles, size,
+                                                        flist[i][6:]))
+                pending.sort()
+            for i in pending:
+                resp[i] = "Error: transfer failed for '%s'" % flist[i]
 
             return resp
 
         else:
             # Get a single file, return the raw contents to the caller.
-            url = requests.get(self.svc_url + "/get?name=%s" % nm,
-                               headers=hdrs)
-            r = requests.get(url.text, stream=False, headers=hdrs)
+            url = self._fetch.get(self.svc_url + "/get",
+                                  params={'name': nm}, headers=hdrs,
+                                  timeout=self.timeout)
+            if url.status_code != 200:
+                return "Error: " + scToString(url.text)
+            r = self._fetch.get(url.text, stream=False, timeout=timeout)
             if mode == 'text':
                 return scToString(r.content)
             elif mode == 'binary':
                 return r.content
             elif mode == 'fileobj':
                 from astropy.utils.data import get_readable_fileobj
-                from io import BytesIO
                 try:
-                    fileobj = BytesIO(r.content)
+                    fileobj = io.BytesIO(r.content)
                     with get_readable_fileobj(fileobj, encoding='binary',
                                                cache=True) as f:
                         return f
@@ -1662,6 +1870,108 @@ class storeClient(object):
                 return scToString(r.content)
 
 
+    def _getFile(self, f, dlname, hdrs, timeout=30, progress=None):
+        '''Download a single file ``f`` to the local path ``dlname``.  If
+           ``progress`` is set, a progress bar using it as a prefix is
+           printed during the transfer.  The ``timeout`` (sec) applies to
+           the connection and to each read.  Returns 'OK', an error string,
+           or None if the transfer failed and should be retried.
+        '''
+        # Get the download URL for the file.
+        res = self._fetch.get(self.svc_url + "/get", params={'name': f},
+                              headers=hdrs, timeout=self.timeout)
+        if res.status_code != 200:
+            return "Error: " + scToString(res.text)
+
+        # Connection errors and gateway failures are retried with backoff
+        # by the session, anything left is retried by the caller.
+        try:
+            r = self._fetch.get(res.text, stream=True, timeout=timeout)
+        except requests.exceptions.RequestException:
+            return None
+
+        if r.status_code != 200:
+            return scToString(r.content)
+
+        clen = r.headers.get('content-length')
+        total_length = (0 if clen is None else int(clen))
+
+        # Verify the download against a Content-MD5 header when the server
+        # provides one for an unencoded body.
+        md5 = r.headers.get('content-md5')
+        if md5 and not r.headers.get('content-encoding'):
+            chksum = hashlib.md5()
+        else:
+            chksum = None
+
+        # Stream the file to disk in chunks so we can have a progress
+        # indicator on each.
+        dl = 0
+        done = 0
+        last_done = -1
+        last_draw = 0.0
+        # A read error leaves a partial file, which is removed so the
+        # caller can retry the transfer.
+        try:
+            with open(dlname, 'wb', 0) as fd:
+                if not progress and chksum is None:
+                    # No per-block work is needed, let shutil do the copy.
+                    r.raw.decode_content = True
+                    shutil.copyfileobj(r.raw, fd, DL_CHUNK_SIZE)
+                    dl = fd.tell()
+                else:
+                    for buf in r.iter_content(chunk_size=DL_CHUNK_SIZE):
+                        dl += len(buf)
+                        fd.write(buf)
+                        if chksum is not None:
+                            chksum.update(buf)
+                        if total_length > 0:
+                            done = min(20, int(20 * dl / total_length))
+                            if done == last_done:
+                                continue        # only redraw when the bar moves
+                            last_done = done
+                        elif progress:
+                            # Without a length the bar can't move, so limit
+                            # the redraw rate instead.
+                            now = time.monotonic()
+                            if now - last_draw < DL_PROGRESS_INTERVAL:
+                                continue
+                            last_draw = now
+                        if progress:            # Print a progress indicator
+                            sys.stdout.write("\r%s [%s%s] [%7s] %s" % \
+                                (progress, '='*done, ' '*(20-done),
+                                sizeof_fmt(dl), f[6:]))
+                            sys.stdout.flush()
+        except (requests.exceptions.RequestException,
+                urllib3.exceptions.HTTPError):
+            _removeFile(dlname)
+            return None
+        finally:
+            r.close()                   # release the pooled connection
+
+        # A corrupted download is retried.
+        if chksum is not None and \
+           base64.b64encode(chksum.digest()).decode() != md5.strip():
+            _removeFile(dlname)
+            return None
+
+        # If the download failed, signal that it should be retried.
+        if total_length > 0 and dl == 0:
+            return None
+
+        # Handle a zero-length file download.
+        if progress:
+            if dl == 0:
+                print("\r%s [%s] [%7s] %s" % \
+                    (progress, '=' * 20, "0 B", f[6:]))
+            elif total_length > 0:
+                print('')
+            else:
+                print("\r%s [%s] [%7s] %s" % \
+                    (progress, ' ' * 20, sizeof_fmt(dl), f[6:]))
+        return 'OK'
+
+
     # --------------------------------------------------------------------
     # PUT -- Upload a file to the Storage Manager service
     # --------------------------------------------------------------------
@@ -1700,25 +2010,25 @@ class storeClient(object):
         return self._put(fr=fr, to=to, token=def_token(token),
                           verbose=verbose, debug=debug)
 
+    @_modifies
     def _put(self, token=None, fr='', to='vos://', verbose=True, debug=False):
         '''Implementation of the ``put()`` method.
         '''
         tok = def_token(token)
-        user, uid, gid, hash = split_auth_token(tok.strip())
-        hdrs = {'Content-Type': 'text/ascii',
-                'X-DL-ClientVersion': __version__,
-                'X-DL-OriginIP': self.hostip,
-                'X-DL-OriginHost': self.hostname,
-                'X-DL-User': user,
-                'X-DL-AuthToken': tok}                  # application/x-sql
+        hdrs = self._authHeaders(tok)
 
         # If the 'fr' is a directory, create it first and then transfer the
         # contents.
         if os.path.isdir(fr):
             if fr.endswith("/"):
-                dname = (to if to.count("://") > 0 else to[:-1])
+                dname = (to if "://" in to else to[:-1])
                 self._mkdir(token=token, name=dname)
-            flist = glob.glob(fr+"/*")
+            # Only regular files can be uploaded, scandir() tells us which
+            # entries those are without a stat() of each one.  Hidden files
+            # are skipped as glob() did.
+            with os.scandir(fr) as it:
+                flist = [e.path for e in it
+                         if not e.name.startswith('.') and e.is_file()]
         else:
             dname = ''
             flist = glob.glob(fr)
@@ -1729,76 +2039,105 @@ class storeClient(object):
             print(flist)
 
         if nfiles > 1:
-            #pstat = stat(to)
-            #ptype = pstat.get('type')
-            ptype = stat(to).get('type')
+            ptype = self._stat(path=to, token=tok).get('type')
             if ptype is None:
                 return ['Error: target directory not exist']
             elif ptype != 'container':
                 return ['Error: target must be a container']
 
-        fnum = 1
-        resp = []
-        for f in flist:
-            if debug:
-                print("put: f=%s" % (f))
-            fr_dir, fr_name = os.path.split(f)
+        # When files go into the 'to/' container, a single listing of it
+        # tells us which names already exist, only those can be a
+        # container we'd upload into.  Otherwise each file is checked.
+        existing = None
+        if nfiles > 1 and to.endswith('/'):
+            listing = self._ls(token=token, name=to, format='csv')
+            if not listing.startswith('Error'):
+                existing = set(listing.split(','))
+
+        # Upload the files concurrently, printing a status line as each
+        # file completes.
+        nworkers = max(1, min(self.max_workers, nfiles))
+        resp = [None] * nfiles
+        with ThreadPoolExecutor(max_workers=nworkers) as ex:
+            futures = {ex.submit(self._putFile, f, to, hdrs, token, debug,
+                                 existing): i
+                       for i, f in enumerate(flist)}
+            for fnum, fut in enumerate(as_completed(futures), 1):
+                i = futures[fut]
+                status, nm = fut.result()
+                resp[i] = status
+                if verbose:
+                    print("(%d / %d) %s -> %s" % (fnum, nfiles, flist[i],
+                          (nm if status == 'OK' else status)))
 
-            if any(i in fr_name for i in URI_RESERVED):
-                resp.append('Error: URI reserved char in source filename: '+f)
-                continue
+        return 'OK' if not resp else resp
 
-            # Patch the names with the URI prefix if needed.
-            nm = (to if to.count("://") > 0 else ("vos://" + to))
-            if to.endswith("/"):
-                nm = nm + fr_name
-            if is_vosDir(self.svc_url, token, nm):
-                nm = nm + '/' + fr_name
-            nm = nm.replace('///','//')      # fix extra path indicators
 
-            if any(i in nm[nm.rfind('/')+1:] for i in URI_RESERVED):
-                resp.append('Error: URI reserved char in target filename: '+nm)
-                continue
+    def _putFile(self, f, to, hdrs, token, debug=False, existing=None):
+        '''Upload a single local file ``f`` to the VOSpace destination
+           ``to``.  Returns a tuple of the status ('OK' or an error string)
+           and the remote file name.  If given, ``existing`` is the set of
+           names already in the ``to`` container.
+        '''
+        if debug:
+            print("put: f=%s" % (f))
+        fr_dir, fr_name = os.path.split(f)
 
-            if debug:
-                print("put: fr_dir=%s  fr_name=%s" % (fr_dir,fr_name))
-                print("put: f=%s  nm(to)=%s" % (f,nm))
+        if any(i in fr_name for i in URI_RESERVED):
+            return ('Error: URI reserved char in source filename: '+f, '')
 
-            if not os.path.exists(f):
-                # Skip files that don't exist
-                resp.append("Error: Local file '%s' does not exist" % f)
-                if verbose:
-                    print("Error: Local file '%s' does not exist" % f)
-                continue
+        # Patch the names with the URI prefix if needed.
+        nm = (to if "://" in to else ("vos://" + to))
+        if to.endswith("/"):
+            nm = nm + fr_name
+        if (existing is None or fr_name in existing) and \
+           is_vosDir(self.svc_url, token, nm, client=self):
+            nm = nm + '/' + fr_name
+        nm = nm.replace('///','//')      # fix extra path indicators
 
-            r = requests.get(self.svc_url + "/put?name=%s" % nm, headers=hdrs)
+        if any(i in nm[nm.rfind('/')+1:] for i in URI_RESERVED):
+            return ('Error: URI reserved char in target filename: '+nm, nm)
 
-            # Cannot upload directly to a container
-            # if r.status_code == 500 and \
-            #    r.content == "Data cannot be uploaded to a container":
-            # This is now handles above where we check for a container using is_vosDir
-            if r.status_code == requests.codes.server_error:
-                resp.append(scToString(r.content))
-            else:
-                try:
-                    if verbose:
-                        sys.stdout.write("(%d / %d) %s -> " % (fnum, nfiles, f))
+        if debug:
+            print("put: fr_dir=%s  fr_name=%s" % (fr_dir,fr_name))
+            print("put: f=%s  nm(to)=%s" % (f,nm))
 
-                    # This *should* work for large data files - MJG 05/24/17
-                    with open(f, 'rb') as file:
-                        requests.put(r.content, data=file,
-                             headers={'Content-type': 'application/octet-stream',
-                                      'X-DL-AuthToken': token})
-                    if verbose:
-                        sys.stdout.write("%s\n" % nm)
+        try:
+            size = os.stat(f).st_size
+        except OSError:
+            # Skip files that don't exist
+            return ("Error: Local file '%s' does not exist" % f, nm)
 
-                except Exception as e:
-                    resp.append(str(e))
-                else:
-                    resp.append('OK')
-            fnum += 1
+        try:
+            # The open file is streamed from disk in blocks.
+            with open(f, 'rb') as file:
+                return (self._putData(file, size, nm, hdrs, token), nm)
+        except Exception as e:
+            return (str(e), nm)
 
-        return 'OK' if not resp else resp
+
+    def _putData(self, data, size, nm, hdrs, token):
+        '''Upload ``size`` bytes read from the file-like object ``data`` to
+           the VOSpace file ``nm``.  Returns 'OK' or an error string.
+        '''
+        r = self.session.get(self.svc_url + "/put", params={'name': nm},
+                             headers=hdrs, timeout=self.op_timeout)
+
+        # Cannot upload directly to a container
+        # if r.status_code == 500 and \
+        #    r.content == "Data cannot be uploaded to a container":
+        # This is now handles above where we check for a container using is_vosDir
+        if r.status_code == requests.codes.server_error:
+            return scToString(r.content)
+
+        # An explicit Content-Length keeps the upload from being sent
+        # chunked, which requests would otherwise do for an empty body.
+        self.session.put(r.content, data=(data if size > 0 else b''),
+                         headers={'Content-type': 'application/octet-stream',
+                                  'Content-Length': str(size),
+                                  'X-DL-AuthToken': token},
+                         timeout=self.op_timeout)
+        return 'OK'
 
 
     # -------------------------------------------------------------------------
@@ -1834,19 +2173,15 @@ class storeClient(object):
         return self._load(name=name, endpoint=endpoint,
                            token=def_token(token), is_vospace=is_vospace)
 
+    @_modifies
     def _load(self, token=None, name='', endpoint='', is_vospace=False):
         '''Implementation of the ``load()`` method.
         '''
-        try:
-            from urllib import quote_plus               # Python 2
-        except ImportError:
-            from urllib.parse import quote_plus         # Python 3
-
-        uri = (name if name.count('://') > 0 else 'vos://' + name)
-        r = self.getFromURL(self.svc_url,
-                            "/load?name=%s&endpoint=%s&is_vospace=%s" % \
-                            (uri, quote_plus(endpoint), str(is_vospace)),
-                            def_token(token))
+        tok = def_token(token)
+        uri = (name if '://' in name else 'vos://' + name)
+        r = self.getFromURL(self.svc_url, "/load", tok,
+                            params={'name': uri, 'endpoint': endpoint,
+                                    'is_vospace': is_vospace})
         return scToString(r.content)
 
 
@@ -1877,12 +2212,14 @@ class storeClient(object):
         '''
         return self._cp(fr=fr, to=to, token=def_token(token), verbose=verbose)
 
+    @_modifies
     def _cp(self, token=None, fr='', to='', verbose=False):
         '''Implementation of the ``cp()`` method.
         '''
+        tok = def_token(token)
         # Patch the names with the URI prefix if needed.
-        fr_rem = fr.count("://") > 0
-        to_rem = to.count("://") > 0
+        fr_rem = "://" in fr
+        to_rem = "://" in to
         if not fr_rem and not to_rem:
             src = "vos://" + fr
             dest = "vos://" + to
@@ -1899,35 +2236,41 @@ class storeClient(object):
         if not hasmeta(fr):
             src = src.replace('///','//')
             dest = dest.replace('///','//')
-            r = self.getFromURL(self.svc_url, "/cp?from=%s&to=%s" % \
-                                   (src, dest), def_token(token))
+            r = self.getFromURL(self.svc_url, "/cp", tok,
+                                params={'from': src, 'to': dest})
             if 'COMPLETED' in scToString(r.content):
                 return "OK"
             else:
                 return scToString(r.content)
         else:
             try:
-                flist = expandFileList(self.svc_url, token, src, "csv",
-                                       full=True)
+                flist = expandFileList(self.svc_url, tok, src, "csv",
+                                       full=True, client=self)
             except Exception as e:
                 return str(e)
             nfiles = len(flist)
-            fnum = 1
-            resp = []
-            for f in flist:
-                junk, fn = os.path.split(f)
-                to_fname = (dest + ('/%s' % fn)).replace('///','//')
+
+            # Copy the files concurrently, results are kept in order.
+            # VOSpace names always use '/', and the target prefix is the
+            # same for every file.
+            prefix = (dest + '/').replace('///','//')
+            def _cp1(arg):
+                fnum, f = arg
+                to_fname = prefix + posixpath.basename(f)
                 if verbose:
-                    print("(%d / %d) %s -> %s" % (fnum, nfiles, f, to_fname))
-                r = self.getFromURL(self.svc_url, "/cp?from=%s&to=%s" % \
-                                       (f, to_fname), def_token(token))
-                fnum += 1
+                    sys.stdout.write("(%d / %d) %s -> %s\n" % \
+                                     (fnum, nfiles, f, to_fname))
+                try:
+                    r = self.getFromURL(self.svc_url, "/cp", tok,
+                                        params={'from': f, 'to': to_fname})
+                except storeClientError as e:
+                    return str(e)
                 if 'COMPLETED' in scToString(r.content):
-                    resp.append("OK")
+                    return "OK"
                 else:
-                    resp.append(scToString(r.content))
+                    return scToString(r.content)
 
-            return resp
+            return self._pmap(_cp1, list(enumerate(flist, 1)))
 
 
     # ----------------------------------------------------------------------
@@ -1954,20 +2297,22 @@ class storeClient(object):
         return self._ln(fr=fr, target=target, token=def_token(token),
                            verbose=verbose)
 
+    @_modifies
     def _ln(self, token=None, fr='', target='', verbose=True):
         '''Implementation of the ``ln()`` method.
         '''
+        tok = def_token(token)
         try:
-            fro = (fr if fr.count('://') > 0 else 'vos://' + fr)
-            to = (target if target.count('://') > 0 else 'vos://' + target)
-            r = self.getFromURL(self.svc_url, "/ln?from=%s&to=%s" % \
-                                   (fro, to), def_token(token))
+            fro = (fr if '://' in fr else 'vos://' + fr)
+            to = (target if '://' in target else 'vos://' + target)
+            r = self.getFromURL(self.svc_url, "/ln", tok,
+                                params={'from': fro, 'to': to})
             if r.status_code != requests.codes.created:
                 return scToString(r.content)
             else:
                 return 'OK'
-        except Exception:
-            raise storeClientError(r.content)
+        except Exception as e:
+            raise storeClientError(str(e))
 
 
     # --------------------------------------------------------------------
@@ -1986,7 +2331,7 @@ class storeClient(object):
         ''' Usage::  storeClient.ls(name)
                      storeClient.ls(token, name='foo')
         '''
-        if optval is not None and is_auth_token(optval):
+        if isinstance(optval, str) and is_auth_token(optval):
             # optval looks like a token
             return self._ls(name=name, format=format,
                             token=def_token(optval), verbose=verbose)
@@ -2004,20 +2349,39 @@ class storeClient(object):
     def _ls(self, token=None, name='vos://', format='csv', verbose=False):
         '''Implementation of the ``ls()`` method.
         '''
-        name = '' if name is None else name
+        tok = def_token(token)
+        if isinstance(name, (list, tuple)):
+            return self._pmap(lambda n: self._ls(token=tok, name=n,
+                                  format=format, verbose=verbose), name)
+
+        nm = '' if name is None else name
         try:
-            uri = (name if name.count('://') > 0 else 'vos://' + name)
-            r = self.getFromURL(self.svc_url,
-                                   "/ls?name=%s&format=%s&verbose=%s" % \
-                                   (uri, format, verbose), def_token(token))
-        except:
-            raise Exception(scToString(r.content))
+            uri = (nm if '://' in nm else 'vos://' + nm)
+            r = self._lsRaw(uri, tok, format=format, verbose=verbose)
+        except Exception as e:
+            raise Exception(str(e))
         else:
             if r.status_code != 200:
                 return('Error %d: "%s" %s' % (r.status_code,uri,r.reason))
             else:
                 return(scToString(r.content))
 
+    def _lsRaw(self, uri, tok, format='csv', verbose=False, svc_url=None):
+        '''Return the /ls response for the VOSpace ``uri``.  Responses are
+           kept in the client's cache, keyed on the canonical name, so
+           ls() calls and wildcard expansions of the same directory share
+           one request.
+        '''
+        svc_url = svc_url or self.svc_url
+        key = uri.replace(':///', '://', 1)
+        if not key.endswith('://'):
+            key = key.rstrip('/')
+        return self._cached(('ls', svc_url, key, format, tok, verbose),
+                            lambda: self.getFromURL(svc_url, "/ls", tok,
+                                        params={'name': uri, 'format': format,
+                                                'verbose': verbose},
+                                        fetch=True))
+
 
     # --------------------------------------------------------------------
     # MKDIR -- Create a directory in the Storage Manager service
@@ -2037,19 +2401,21 @@ class storeClient(object):
         else:
             return self._mkdir(name=optval, token=def_token(token))
 
+    @_modifies
     def _mkdir(self, token=None, name=''):
         '''Implementation of the ``mkdir()`` method.
         '''
-        nm = (name if name.count("://") > 0 else ("vos://" + name))
+        tok = def_token(token)
+        nm = (name if "://" in name else ("vos://" + name))
         if nm and nm[-1] == '/': nm = nm[:-1]
 
         try:
-            r = self.getFromURL(self.svc_url, "/mkdir?dir=%s" % nm,
-                                   def_token(token))
+            r = self.getFromURL(self.svc_url, "/mkdir", tok,
+                                params={'dir': nm})
             if r.status_code != requests.codes.created: return scToString(r.content)
             else: return 'OK'
-        except Exception:
-            raise storeClientError(r.content)
+        except Exception as e:
+            raise storeClientError(str(e))
         else:
             return 'OK'
 
@@ -2081,12 +2447,14 @@ class storeClient(object):
         '''
         return self._mv(fr=fr, to=to, token=def_token(token), verbose=verbose)
 
+    @_modifies
     def _mv(self, token=None, fr='', to='', verbose=False):
         '''Implementation of the ``mv()`` method.
         '''
+        tok = def_token(token)
         # Patch the names with the URI prefix if needed.
-        fr_rem = fr.count("://") > 0
-        to_rem = to.count("://") > 0
+        fr_rem = "://" in fr
+        to_rem = "://" in to
         if not fr_rem and not to_rem:
             src = "vos://" + fr
             dest = "vos://" + to
@@ -2104,36 +2472,41 @@ class storeClient(object):
         if not hasmeta(fr):
             src = src.replace('///','//')
             dest = dest.replace('///','//')
-            r = self.getFromURL(self.svc_url, "/mv?from=%s&to=%s" % \
-                                   (src, dest), def_token(token))
+            r = self.getFromURL(self.svc_url, "/mv", tok,
+                                params={'from': src, 'to': dest})
             if 'COMPLETED' in scToString(r.content):
                 return "OK"
             else:
                 return scToString(r.content)
         else:
             try:
-                flist = expandFileList(self.svc_url, token, src, "csv",
-                                       full=True)
+                flist = expandFileList(self.svc_url, tok, src, "csv",
+                                       full=True, client=self)
             except Exception as e:
                 return str(e)
-            print (str(flist))
             nfiles = len(flist)
-            fnum = 1
-            resp = []
-            for f in flist:
-                print ('f: ' + str(f))
-                junk, fn = os.path.split(f)
-                to_fname = (dest + ('/%s' % fn)).replace('///','//')
+
+            # Move the files concurrently, results are kept in order.
+            # VOSpace names always use '/', and the target prefix is the
+            # same for every file.
+            prefix = (dest + '/').replace('///','//')
+            def _mv1(arg):
+                fnum, f = arg
+                to_fname = prefix + posixpath.basename(f)
                 if verbose:
-                    print("(%d / %d) %s -> %s" % (fnum, nfiles, f, to_fname))
-                r = self.getFromURL(self.svc_url, "/mv?from=%s&to=%s" % \
-                                       (f,to_fname), def_token(token))
-                fnum += 1
+                    sys.stdout.write("(%d / %d) %s -> %s\n" % \
+                                     (fnum, nfiles, f, to_fname))
+                try:
+                    r = self.getFromURL(self.svc_url, "/mv", tok,
+                                        params={'from': f, 'to': to_fname})
+                except storeClientError as e:
+                    return str(e)
                 if 'COMPLETED' in scToString(r.content):
-                    resp.append("OK")
+                    return "OK"
                 else:
-                    resp.append(scToString(r.content))
-            return resp
+                    return scToString(r.content)
+
+            return self._pmap(_mv1, list(enumerate(flist, 1)))
 
 
     # --------------------------------------------------------------------
@@ -2149,7 +2522,7 @@ class storeClient(object):
     def rm(self, optval, name='', token=None, verbose=False):
         ''' Usage::  storeClient.rm(name)
         '''
-        if optval is not None and is_auth_token(optval):
+        if isinstance(optval, str) and is_auth_token(optval):
             # optval looks like a token
             return self._rm(name=name,token=def_token(optval),verbose=verbose)
         else:
@@ -2161,43 +2534,62 @@ class storeClient(object):
         '''
         return self._rm(name=name, token=def_token(token), verbose=verbose)
 
+    @_modifies
     def _rm(self, token=None, name='', verbose=False):
         '''Implementation of the ``rm()`` method.
         '''
+        tok = def_token(token)
+        if isinstance(name, (list, tuple)):
+            return self._pmap(lambda n: self._rm(token=tok, name=n,
+                                  verbose=verbose), name)
+
         # Patch the names with the URI prefix if needed.
-        nm = (name if name.count("://") > 0 else ("vos://" + name))
-        if nm == "vos://" or nm == "vos://tmp" or nm == "vos://public":
+        nm = (name if "://" in name else ("vos://" + name))
+        if nm in _PROTECTED:
             return "Error: operation not permitted"
 
         # If the 'name' string has no metacharacters we're removing a single file,
         # otherwise expand the file list on the and process the matches
         # individually.
         if not hasmeta(nm):
-            r = is_vosDir(self.svc_url, token, nm)
-            if not isinstance(r, bool): return scToString(r.content)
-            elif r: return "%s is a directory." % name
-
-            r = self.getFromURL(self.svc_url, "/rm?file=%s" % nm, def_token(token))
-            if r.status_code != requests.codes.no_content:
-                return scToString(r.content)
-            else:
-                return 'OK'
+            return self._rmFile(nm, tok, name)
         else:
             try:
-                flist = expandFileList(self.svc_url, token, nm, "csv",
-                                       full=True)
+                flist = expandFileList(self.svc_url, tok, nm, "csv",
+                                       full=True, client=self)
             except Exception as e:
                 return str(e)
             nfiles = len(flist)
             if nfiles < 1:
                 return 'A Node does not exist with the requested URI.'
-            fnum = 1
-            resp = []
-            for f in flist:
-                if verbose: print("(%d / %d) %s" % (fnum, nfiles, f))
-                resp.append(self._rm(token=token, name=f, verbose=verbose))
-                fnum += 1
-            return resp
+
+            # Remove the files concurrently, results are kept in order.
+            def _rm1(arg):
+                fnum, f = arg
+                if verbose: sys.stdout.write("(%d / %d) %s\n" % (fnum, nfiles, f))
+                try:
+                    return self._rmFile(f, tok, f)
+                except (storeClientError,
+                        requests.exceptions.RequestException) as e:
+                    return str(e)
+
+            return self._pmap(_rm1, list(enumerate(flist, 1)))
+
+
+    def _rmFile(self, nm, tok, name):
+        '''Delete the single VOSpace file ``nm``, ``name`` is the name
+           reported if it turns out to be a directory.  The name is used
+           as-is, it's not expanded as a pattern.
+        '''
+        r = is_vosDir(self.svc_url, tok, nm, client=self)
+        if not isinstance(r, bool): return scToString(r.content)
+        elif r: return "%s is a directory." % name
+
+        r = self.getFromURL(self.svc_url, "/rm", tok, params={'file': nm})
+        if r.status_code != requests.codes.no_content:
+            return scToString(r.content)
+        else:
+            return 'OK'
 
 
     # --------------------------------------------------------------------
@@ -2226,26 +2618,28 @@ class storeClient(object):
         '''
         return self._rmdir(name=name, token=def_token(token), verbose=verbose)
 
+    @_modifies
     def _rmdir(self, token=None, name='', verbose=False):
         '''Implementation of the ``rmdir()`` method.
         '''
+        tok = def_token(token)
         # FIXME - Should handle file templates(?)
 
         # Patch the names with the URI prefix if needed.
-        nm = (name if name.count("://") > 0 else ("vos://" + name))
-        if nm == "vos://" or nm == "vos://tmp" or nm == "vos://public":
+        nm = (name if "://" in name else ("vos://" + name))
+        if nm in _PROTECTED:
             return "Error: operation not permitted"
         if nm and nm[-1] == '/': nm = nm[:-1]
-        r = is_vosDir(self.svc_url, token, nm)
+        r = is_vosDir(self.svc_url, tok, nm, client=self)
         if not isinstance(r, bool): return scToString(r.content)
         elif not r: return "%s is not a directory." % name
         try:
-            r = self.getFromURL(self.svc_url, "/rmdir?dir=%s" % nm,
-                                   def_token(token))
+            r = self.getFromURL(self.svc_url, "/rmdir", tok,
+                                params={'dir': nm})
             if r.status_code != requests.codes.no_content: return scToString(r.content)
             else: return 'OK'
         except Exception as e:
-            print('storeClient._rmdir: error: ' + scToString(r.content))
+            print('storeClient._rmdir: error: ' + str(e))
             raise storeClientError(str(e))
         else:
             return 'OK'
@@ -2266,28 +2660,23 @@ class storeClient(object):
         '''
         return self._saveAs(data=data, name=name, token=def_token(token))
 
+    @_modifies
     def _saveAs(self, token=None, data='', name=''):
         '''Implementation of the ``saveAs()`` method.
         '''
-        import tempfile
+        # Patch the names with the URI prefix if needed.
+        nm = (name if "://" in name else ("vos://" + name))
+        if any(i in nm[nm.rfind('/')+1:] for i in URI_RESERVED):
+            return ['Error: URI reserved char in target filename: ' + nm]
 
+        # Upload the data straight from memory rather than through a
+        # temp file.  The result is a list as returned by put().
+        buf = io.BytesIO(str(data).encode('utf-8'))
         try:
-            with tempfile.NamedTemporaryFile(mode='w',delete=False) as tfd:
-                tfd.write(str(data))
-                tfd.flush()
-                tfd.close()
+            return [self._putData(buf, buf.getbuffer().nbytes, nm,
+                                  self._authHeaders(token), token)]
         except Exception as e:
-            raise storeClientError(str(e))
-
-        # Patch the names with the URI prefix if needed.
-        nm = (name if name.count("://") > 0 else ("vos://" + name))
-
-        # Put the temp file to the VOSpace.
-        resp = self._put(token=token, fr=tfd.name, to=nm, verbose=False)
-
-        os.unlink(tfd.name)                # Clean up
-
-        return resp
+            return [str(e)]
 
 
     # --------------------------------------------------------------------
@@ -2311,14 +2700,16 @@ class storeClient(object):
         '''
         return self._tag(name=name, tag=tag, token=def_token(token))
 
+    @_modifies
     def _tag(self, token=None, name='', tag=''):
         '''Implementation of the ``tag()`` method.
         '''
+        tok = def_token(token)
         try:
-            r = self.getFromURL(self.svc_url, "/tag?name=%s&tag=%s" % \
-                                   (name, tag), def_token(token))
-        except Exception:
-            raise storeClientError(scToString(r.content))
+            r = self.getFromURL(self.svc_url, "/tag", tok,
+                                params={'name': name, 'tag': tag})
+        except Exception as e:
+            raise storeClientError(str(e))
         else:
             if r.status_code == requests.codes.ok:
                 return 'OK'
@@ -2326,55 +2717,134 @@ class storeClient(object):
                 return scToString(r.content)
 
 
-    def getFromURL(self, svc_url, path, token):
-        '''Get something from a URL.  Return a 'response' object.
+    def getFromURL(self, svc_url, path, token, params=None, fetch=False):
+        '''Get something from a URL.  Return a 'response' object.  The
+           query ``params`` are encoded by requests.  Only read-only
+           calls may set ``fetch`` to use the retrying session, all others
+           are service operations sent once with the ``op_timeout``.
         '''
         try:
-            tok = def_token(token)
-            user, uid, gid, hash = split_auth_token(tok.strip())
-
-            hdrs = {'Content-Type': 'text/ascii',
-                    'X-DL-ClientVersion': __version__,
-                    'X-DL-OriginIP': self.hostip,
-                    'X-DL-OriginHost': self.hostname,
-                    'X-DL-User': user,
-                    'X-DL-AuthToken': tok}  		# application/x-sql
-
-            resp = requests.get("%s%s" % (svc_url, path), headers=hdrs)
+            hdrs = self._authHeaders(def_token(token))
+            if fetch:
+                resp = self._fetch.get(svc_url + path, params=params,
+                                       headers=hdrs, timeout=self.timeout)
+            else:
+                resp = self.session.get(svc_url + path, params=params,
+                                        headers=hdrs, timeout=self.op_timeout)
 
         except Exception as e:
             raise storeClientError(str(e))
         return resp
 
 
+    def _authHeaders(self, tok):
+        '''Return the request headers identifying the user of token
+           ``tok``.  The headers for the last token are kept since a
+           client nearly always uses the same one.
+        '''
+        last_tok, hdrs = self._auth_hdrs
+        if tok != last_tok:
+            user, uid, gid, hash = split_auth_token(tok.strip())
+            hdrs = {'Content-Type': 'text/ascii',
+                    'X-DL-User': user,
+                    'X-DL-AuthToken': tok}          # application/x-sql
+            self._auth_hdrs = (tok, hdrs)
+        return hdrs
+
+
+    def _pmap(self, func, args):
+        '''Apply ``func`` to each element of ``args`` using concurrent
+           requests, returning the results in order.
+        '''
+        nworkers = max(1, min(self.max_workers, len(args)))
+        with ThreadPoolExecutor(max_workers=nworkers) as ex:
+            return list(ex.map(func, args))
+
 
 
 # -------------------------------------------------------
 #  Utility Methods
 # -------------------------------------------------------
 
+def sizeof_fmt(num):
+    '''Pretty-printer for file sizes.
+    '''
+    for unit in ['B','K','M','G','T','P','E','Z']:
+        if abs(num) < 1024.0:
+            if unit == 'B':
+                return "%5d%s" % (num, unit)
+            else:
+                return "%3.1f%s" % (num, unit)
+        num /= 1024.0
+    return "%.1f%s" % (num, 'Y')
+
+
+_META_RE = re.compile(r'[*?\[]')
+
 def hasmeta(s):
     '''Determine whether a string contains filename meta-characters.
     '''
-    return (s.find('*') >= 0) or (s.find('[') >= 0) or (s.find('?') > 0)
+    return _META_RE.search(s) is not None
 
 
-def is_vosDir(svc_url, token, path):
-    '''Determine whether 'path' is a ContainerNode in the VOSpace.
+@functools.lru_cache(maxsize=256)
+def _globRE(pattern):
+    '''Compile a filename pattern to a regular expression.  Patterns are
+       cached since the same one is matched against every entry of a
+       directory listing.
     '''
-    url = svc_url + ("/isdir?name=%s" % (path))
-    r = requests.get(url, headers={'X-DL-AuthToken': def_token(token)})
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _isJSON(r):
+    '''Determine whether the body of response ``r`` is a JSON object, from
+       its content type or else its first character.
+    '''
+    return ('json' in r.headers.get('Content-Type', '') or
+            r.content.lstrip()[:1] == b'{')
+
+
+def _removeFile(path):
+    '''Remove a partially downloaded local file, ignoring errors.
+    '''
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _jsonLoads(s):
+    '''Decode a JSON document from a str or bytes value, using the orjson
+       decoder when it is installed.
+    '''
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def is_vosDir(svc_url, token, path, client=None):
+    '''Determine whether 'path' is a ContainerNode in the VOSpace.  The
+       request is made on the session of the ``client``, by default the
+       module's client.
+    '''
+    sc = (sc_client if client is None else client)
+    r = sc._fetch.get(svc_url + "/isdir", params={'name': path},
+                      headers={'X-DL-AuthToken': def_token(token)},
+                      timeout=sc.timeout)
     if r.status_code != requests.codes.ok:
         return r
     else:
         return (True if scToString(r.content).lower() == 'true' else False)
 
-def expandFileList(svc_url, token, pattern, format, full=False):
+def expandFileList(svc_url, token, pattern, format, full=False, client=None):
     '''Expand a filename pattern in a VOSpace URI to a list of files.  We
        do this by getting a listing of the parent container contents from
-       the service and then match the pattern on the client side.
+       the service and then match the pattern on the client side.  The
+       requests are made with the ``client``, by default the module's
+       client.
     '''
     debug = False
+    sc = (sc_client if client is None else client)
 
     # Check first that we're only getting a single file.
     if not hasmeta(pattern) and not pattern.endswith('/'):
@@ -2386,7 +2856,7 @@ def expandFileList(svc_url, token, pattern, format, full=False):
     # moment the expansiom to the VOSpace URI is handled on the server.  We'll
     # prepend this to the service call as needed to ensure a correct argument
     # and give the calling routine the option of leaving it off.
-    if pattern.count('://') > 0:
+    if '://' in pattern:
         str = pattern[pattern.index('://')+3:]
         uri = pattern[:pattern.index('://')+3]
     else:
@@ -2394,7 +2864,7 @@ def expandFileList(svc_url, token, pattern, format, full=False):
         uri = 'vos://'
 
     # Extract the directory and filename/pattern from the string.
-    dir, name = os.path.split(str)
+    dir, name = posixpath.split(str)
     if debug:
         print("-----------------------------------------")
         print("INPUT PATTERN = '" + str + "'")
@@ -2422,34 +2892,44 @@ def expandFileList(svc_url, token, pattern, format, full=False):
     if not hasmeta(name) and name is not None:
         pstr = (name if name != '' else "*")
 
-    # Check to make sure the parent exists and is a container
-    if debug:
-        print ('stat of dir :  ' + (uri+dir))
-    pstat = stat(uri+dir)
-    if pstat.get('type') == 'link':
-        dir = pstat['target']
-        dir = dir[dir.index('://')+3:]
-        pstat = stat(dir)
-    if pstat.get('type') != 'container':
-        raise Exception('A Container does not exist with the requested URI')
-
-    # Make the service call to get a listing of the parent directory.
-    url = svc_url + "/ls?name=%s%s&format=%s" % (uri, dir, "csv")
-    try:
-        r = requests.get(url, headers={'X-DL-AuthToken': def_token(token)})
-    except Exception as e:
-        raise
-
-    # Filter the directory contents list using the filename pattern.
-    list = []
-    flist = scToString(r.content).split(',')
-    for f in flist:
-        if f and (fnmatch.fnmatch(f, pstr) or f == pstr):
-            furi = (f if not full else (uri + dir + "/" + f))
-            list.append(furi.replace("///", "//"))
+    # Make the service call to get a listing of the parent directory.  This
+    # is sent while we check that the parent exists and is a container so
+    # the two round trips overlap, only a link needs a second listing.
+    # Listings are shared with ls() through the client's cache.
+    tok = def_token(token)
+
+    def _listing(name):
+        return scToString(sc._lsRaw(name, tok, svc_url=svc_url).content)
+
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        fut = ex.submit(_listing, uri + dir)
+
+        if debug:
+            print ('stat of dir :  ' + (uri+dir))
+        pstat = sc._stat(path=uri+dir, token=tok)
+        if pstat.get('type') == 'link':
+            dir = pstat['target']
+            dir = dir[dir.index('://')+3:]
+            pstat = sc._stat(path=dir, token=tok)
+            fut = ex.submit(_listing, uri + dir)
+        if pstat.get('type') != 'container':
+            raise Exception('A Container does not exist with the requested URI')
+        listing = fut.result()
+
+    # Filter the directory contents list using the filename pattern, a
+    # '*' matches every name so no pattern match is needed.
+    flist = listing.split(',')
+    if pstr == '*':
+        list = [f for f in flist if f]
+    else:
+        pmatch = _globRE(pstr).match
+        list = [f for f in flist if f and (pmatch(f) or f == pstr)]
+    if full:
+        prefix = (uri + dir + "/").replace("///", "//")
+        list = [prefix + f for f in list]
 
     if debug:
-        print(url)
+        print(uri + dir)
         print("%s --> '%s' '%s' '%s' => '%s'" % (pattern,uri,dir,name,pstr))
 
     return sorted(list)
@@ -2465,23 +2945,25 @@ def chunked_upload(token, local_file, remote_file):
     '''
     debug = False
     init = True
-    CHUNK_SIZE = 4 * 1024 * 1024                   # 16MB chunks
+    CHUNK_SIZE = 4 * 1024 * 1024                   # 4MB chunks
     url = '%s/xfer' % (sc_client.svc_url)
 
-    # Get the size of the file to be transferred.
+    # Get the size of the file to be transferred.  The service expects
+    # each chunk as a separate POST, the first flagged with X-DL-InitXfer.
     fsize = os.stat(local_file).st_size
-    nchunks = fsize / CHUNK_SIZE + 1
+    nchunks = (fsize + CHUNK_SIZE - 1) // CHUNK_SIZE
     if (debug): print('Upload in %d chunks' % nchunks)
     with open(local_file, 'rb') as f:
         try:
             nsent = 0
             while nsent < fsize:
                 data = f.read(CHUNK_SIZE)
-                requests.post(url, data,
+                sc_client.session.post(url, data,
                     headers={'Content-type': 'application/octet-stream',
                              'X-DL-FileName': remote_file,
                              'X-DL-InitXfer': str(init),
-                             'X-DL-AuthToken': token})
+                             'X-DL-AuthToken': token},
+                    timeout=sc_client.op_timeout)
                 nsent += len(data)
                 if init: init = False
         except Exception as e:
@@ -2513,29 +2995,37 @@ set_svc_url.__doc__ = sc_client.set_svc_url.__doc__
 get_svc_url.__doc__ = sc_client.get_svc_url.__doc__
 set_profile.__doc__ = sc_client.set_profile.__doc__
 get_profile.__doc__ = sc_client.get_profile.__doc__
+clear_cache.__doc__ = sc_client.clear_cache.__doc__
+set_max_workers.__doc__ = sc_client.set_max_workers.__doc__
+get_max_workers.__doc__ = sc_client.get_max_workers.__doc__
 
 
 # ####################################################################
 #  Py2/Py3 Compatability Utilities
 # ####################################################################
 
-def scToString(s):
-    '''scToString -- Force a return value to be type 'string' for all
-                     Python versions.  If there is an error, return the
-                     original.
-    '''
-    try:
-        if is_py3:
-            if isinstance(s,bytes):
-                strval = str(s.decode())
-            elif isinstance(s,str):
-                strval = s
-        else:
+# The version test is made once here rather than on every call.
+if is_py3:
+    def scToString(s):
+        '''scToString -- Force a return value to be type 'string' for all
+                         Python versions.  If there is an error, return the
+                         original.
+        '''
+        if type(s) is bytes:
+            try:
+                return s.decode()
+            except UnicodeDecodeError:
+                return s
+        return s
+else:
+    def scToString(s):
+        '''scToString -- Force a return value to be type 'string' for all
+                         Python versions.  If there is an error, return the
+                         original.
+        '''
+        try:
             if isinstance(s,bytes) or isinstance(s,unicode):
-                strval = str(s)
-            else:
-                strval = s
-    except:
+                return str(s)
+        except:
+            pass
         return s
-
-    return strval
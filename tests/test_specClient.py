@@ -0,0 +1,142 @@
+"""
+    test_specClient.py - test the offline helpers in dl/specClient.py
+    To run the test everything simply do:
+        pytest tests/test_specClient.py
+    Importing the module contacts the Spectroscopic Data service to set
+    up the default client, so the tests are skipped when it is not
+    available.
+"""
+
+import os
+import sys
+import pytest
+import numpy as np
+
+# position the script relative to the code
+ROOT_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(ROOT_PATH, '..'))
+try:
+    import dl.specClient as spc
+except Exception as e:
+    pytest.skip('specClient unavailable: %s' % e, allow_module_level=True)
+
+
+@pytest.fixture
+def client():
+    '''A specClient with a fixed context that never calls the service.
+    '''
+    sc = spc.specClient.__new__(spc.specClient)
+    sc.context = {'id_main': 'specobjid'}
+    return sc
+
+
+@pytest.mark.parametrize(
+    "id_list, expected, dtype",
+    [
+        ("1299", [1299], np.int64),
+        ("2254915084697528320", [2254915084697528320], np.int64),
+        ("9223372036854775808", [9223372036854775808], np.uint64),
+    ]
+)
+def test_extract_id_list_strings(client, id_list, expected, dtype):
+    ids = client.extractIDList(id_list)
+    assert ids.dtype == dtype
+    assert ids.tolist() == expected
+
+
+def test_extract_id_list_file(client, tmp_path):
+    id_file = str(tmp_path / "ids.txt")
+    with open(id_file, "w") as fd:
+        fd.write("1\n\n18446744073709551615\n")
+    ids = client.extractIDList(id_file)
+    assert ids.dtype == np.uint64
+    assert ids.tolist() == [1, 18446744073709551615]
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        np.array([1, 2, 3]),
+        np.array([9223372036854775808, 1], dtype=np.uint64),
+        np.array([], dtype=np.int64),
+        [1, 2, 3],
+    ]
+)
+def test_id_list_string(client, ids):
+    assert client.idListString(ids) == str([int(i) for i in ids])
+
+
+@pytest.mark.parametrize(
+    "id_list, expected",
+    [
+        (1299, [1299]),
+        ((266, 51630, 3), [(266, 51630, 3)]),
+        ([1, 2], [1, 2]),
+        (np.array([1, 2]), [1, 2]),
+        (np.array([[1, 9], [2, 9]]), [1, 2]),
+        (np.array([(1, 9.0)], dtype=[('specobjid', 'i8'), ('z', 'f8')]),
+         [1]),
+    ]
+)
+def test_extract_id_list_types(client, id_list, expected):
+    assert list(client.extractIDList(id_list)) == expected
+
+
+def test_airtovac():
+    air = np.array([1500.0, 4861.363, 6562.801, 9000.0])
+    vac = spc._airtovac(air)
+    assert vac.shape == air.shape
+    assert vac[0] == air[0]                     # below 2000A unchanged
+    assert np.all(vac[1:] > air[1:])
+    assert vac[2] == pytest.approx(6564.614, abs=1e-3)
+    for a, v in zip(air, vac):
+        assert spc._airtovac(a) == pytest.approx(v)
+        assert isinstance(spc._airtovac(a), float)
+    assert spc.airtovac(6562.801) == pytest.approx(vac[2])
+
+
+def _failInit():
+    raise RuntimeError('no workers')
+
+
+@pytest.fixture
+def specs(tmp_path):
+    '''Two small synthetic spectra rendered with the Agg backend.
+    '''
+    spc.plt.switch_backend('Agg')
+    wavelength = np.linspace(4000.0, 7000.0, 200)
+    return [{'wavelength': wavelength, 'flux': np.sin(wavelength / k) + 2,
+             'title': 'spec %d' % k} for k in (50.0, 80.0)]
+
+
+def _checkPNGs(outs, out_dir):
+    assert outs == [os.path.join(str(out_dir), '%d.png' % i)
+                    for i in range(2)]
+    for out in outs:
+        with open(out, 'rb') as fd:
+            assert fd.read(8) == b'\x89PNG\r\n\x1a\n'
+
+
+def test_plot_spec_many(specs, tmp_path):
+    outs = spc.specClient._plotSpecMany(specs, str(tmp_path), n_workers=2)
+    _checkPNGs(outs, tmp_path)
+
+
+def test_plot_spec_many_unpicklable(specs, tmp_path, monkeypatch):
+    rendered = []
+    real_worker = spc._plotWorker
+
+    def worker(spec, out):
+        rendered.append(out)
+        return real_worker(spec, out)
+
+    monkeypatch.setattr(spc, '_plotWorker', worker)
+    outs = spc.specClient._plotSpecMany(specs, str(tmp_path), n_workers=2)
+    _checkPNGs(outs, tmp_path)
+    assert rendered == outs
+
+
+def test_plot_spec_many_broken_pool(specs, tmp_path, monkeypatch):
+    monkeypatch.setattr(spc, '_plotWorkerInit', _failInit)
+    outs = spc.specClient._plotSpecMany(specs, str(tmp_path), n_workers=2)
+    _checkPNGs(outs, tmp_path)
@@ -0,0 +1,364 @@
+"""
+    test_storeClient.py - test the offline helpers in dl/storeClient.py
+    To run the test everything simply do:
+        pytest tests/test_storeClient.py
+    The service calls are answered by a stub session, no network access
+    is needed.
+"""
+
+import os
+import sys
+import json
+import base64
+import hashlib
+import pytest
+import requests
+import urllib3
+
+# position the script relative to the code
+ROOT_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(ROOT_PATH, '..'))
+import dl.storeClient as stc
+
+
+SVC_URL = "http://localhost/storage"
+DATA_URL = "http://localhost/data"
+TOKEN = "unittest.666.666.$1$fdqasldur927JL97asldfj9279172B/"
+
+# A small VOSpace:  the listing and stat results of each node.
+NODES = {
+    'vos://': ('d,lnk,top.txt', {'type': 'container'}),
+    'vos://d': ('a.fits,b.fits,c.txt,?x,sub', {'type': 'container'}),
+    'vos://lnk': ('', {'type': 'link', 'target': 'vos://d'}),
+    'vos://top.txt': ('', {'type': 'data'}),
+}
+
+
+class _Response(object):
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = (content.encode() if isinstance(content, str)
+                        else content)
+        self.text = self.content.decode()
+        self.status_code = status_code
+        self.reason = 'OK'
+        self.headers = headers or {}
+
+
+def _node(name):
+    '''Look up a node by its canonical URI.
+    '''
+    name = name.replace(':///', '://')
+    if not name.endswith('://'):
+        name = name.rstrip('/')
+    return NODES.get(name)
+
+
+class _Download(object):
+    '''Stub for a streamed download, returns the ``chunks`` and then raises
+       ``error`` if it is set.
+    '''
+    def __init__(self, chunks, error=None, headers=None):
+        self.chunks = list(chunks)
+        self.error = error
+        self.status_code = 200
+        self.headers = headers or {}
+        self.raw = self
+        self.closed = False
+
+    def read(self, n=-1):
+        if self.chunks:
+            return self.chunks.pop(0)
+        if self.error is not None:
+            raise self.error
+        return b''
+
+    def iter_content(self, chunk_size=1):
+        buf = self.read()
+        while buf:
+            yield buf
+            buf = self.read()
+
+    def close(self):
+        self.closed = True
+
+
+class _Session(object):
+    '''Stub for the client sessions, answers from NODES and records the
+       requests made.  File downloads are taken from ``downloads``, keyed
+       by URL.
+    '''
+    def __init__(self, calls):
+        self.calls = calls
+        self.downloads = {}
+
+    def get(self, url, params=None, **kw):
+        if url.startswith(DATA_URL):
+            self.calls.append((self, url, params))
+            queue = self.downloads.get(url)
+            return (queue.pop(0) if queue else _Download([b'data']))
+        path = url[len(SVC_URL):]
+        self.calls.append((self, path, params))
+        if path == '/get':
+            return _Response(DATA_URL + '/' + params['name'][6:])
+        elif path == '/ls':
+            return _Response(_node(params['name'])[0])
+        elif path == '/stat':
+            node = _node(params['name'])
+            if node is None:
+                return _Response('Not found', status_code=404)
+            return _Response(json.dumps(node[1]),
+                             headers={'Content-Type': 'application/json'})
+        elif path == '/isdir':
+            node = _node(params['name'])
+            isdir = (node is not None and node[1]['type'] == 'container')
+            return _Response(str(isdir).lower())
+        elif path == '/mkdir':
+            return _Response('', status_code=201)
+        return _Response('true')
+
+    def put(self, url, data=None, **kw):
+        self.calls.append((self, url, None))
+        return _Response('OK')
+
+    def post(self, url, data=None, **kw):
+        self.calls.append((self, url[len(SVC_URL):], data))
+        return _Response('OK')
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    '''A storeClient whose sessions are stubs, along with the list of the
+       requests made.
+    '''
+    calls = []
+    sc = stc.storeClient(svc_url=SVC_URL)
+    sc.session = _Session(calls)
+    sc._fetch = _Session(calls)
+    return sc, calls
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_ttl(client, monkeypatch):
+    sc, calls = client
+    clock = _Clock()
+    monkeypatch.setattr(stc.time, 'monotonic', clock)
+    assert sc._stat(path='vos://d', token=TOKEN) == {'type': 'container'}
+    assert sc._stat(path='vos://d', token=TOKEN) == {'type': 'container'}
+    assert len(calls) == 1
+    clock.now += sc.cache_ttl + 1
+    sc._stat(path='vos://d', token=TOKEN)
+    assert len(calls) == 2
+
+    sc.cache_ttl = 0
+    sc._stat(path='vos://d', token=TOKEN)
+    sc._stat(path='vos://d', token=TOKEN)
+    assert len(calls) == 4
+
+
+def test_cache_returns_copy(client):
+    sc, calls = client
+    sc._stat(path='vos://d', token=TOKEN)['type'] = 'changed'
+    assert sc._stat(path='vos://d', token=TOKEN) == {'type': 'container'}
+
+
+def test_modifies_clears_cache(client):
+    sc, calls = client
+    sc._stat(path='vos://d', token=TOKEN)
+    sc._access(path='vos://d', mode='rw', token=TOKEN)
+    assert len(sc._cache) == 2
+    assert sc._mkdir(token=TOKEN, name='vos://new') == 'OK'
+    assert sc._cache == {}
+    sc._stat(path='vos://d', token=TOKEN)
+    assert [c[1] for c in calls] == ['/stat', '/access', '/mkdir', '/stat']
+
+
+def test_operations_use_session_without_retries(client):
+    sc, calls = client
+    sc._stat(path='vos://d', token=TOKEN)
+    sc._mkdir(token=TOKEN, name='vos://new')
+    assert calls[0][0] is sc._fetch
+    assert calls[1][0] is sc.session
+
+
+def test_access_sends_mode(client):
+    sc, calls = client
+    sc._access(path='d', mode=None, token=TOKEN)
+    assert calls[-1][2] == {'name': 'vos://d', 'mode': 'None',
+                            'verbose': True}
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("", False),
+        ("vos://d/a.fits", False),
+        ("*.fits", True),
+        ("a?.fits", True),
+        ("?x", True),
+        ("[ab].fits", True),
+        ("d/", False),
+    ]
+)
+def test_hasmeta(s, expected):
+    assert stc.hasmeta(s) == expected
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        (b"abc", "abc"),
+        ("abc", "abc"),
+        (b"\xff\xfe", b"\xff\xfe"),
+        (None, None),
+    ]
+)
+def test_scToString(s, expected):
+    assert stc.scToString(s) == expected
+
+
+@pytest.mark.parametrize(
+    "content, headers, expected",
+    [
+        ('{"a": 1}', {}, True),
+        ('  {"a": 1}', {}, True),
+        ('[1, 2]', {'Content-Type': 'application/json'}, True),
+        ('a,b,c', {'Content-Type': 'text/plain'}, False),
+        ('', {}, False),
+    ]
+)
+def test_isJSON(content, headers, expected):
+    assert stc._isJSON(_Response(content, headers=headers)) == expected
+
+
+@pytest.mark.parametrize("s", ['{"a": [1, 2]}', b'{"a": [1, 2]}'])
+def test_jsonLoads(s):
+    assert stc._jsonLoads(s) == {'a': [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "pattern, full, expected",
+    [
+        ("vos://d/a.fits", False, ["vos://d/a.fits"]),
+        ("d/*.fits", False, ["a.fits", "b.fits"]),
+        ("vos://d/?.txt", False, ["c.txt"]),
+        ("d/?x", False, ["?x"]),
+        ("d/", True, ["vos://d/?x", "vos://d/a.fits", "vos://d/b.fits",
+                      "vos://d/c.txt", "vos://d/sub"]),
+        ("*", False, ["d", "lnk", "top.txt"]),
+        ("vos://*.txt", True, ["vos://top.txt"]),
+        ("lnk/*.fits", True, ["vos://d/a.fits", "vos://d/b.fits"]),
+    ]
+)
+def test_expandFileList(client, pattern, full, expected):
+    sc, calls = client
+    assert stc.expandFileList(SVC_URL, TOKEN, pattern, 'csv', full=full,
+                              client=sc) == expected
+
+
+def test_expandFileList_not_container(client):
+    sc, calls = client
+    with pytest.raises(Exception):
+        stc.expandFileList(SVC_URL, TOKEN, 'top.txt/*', 'csv', client=sc)
+
+
+def test_expandFileList_shares_ls_cache(client):
+    sc, calls = client
+    stc.expandFileList(SVC_URL, TOKEN, 'd/*.fits', 'csv', client=sc)
+    assert sc._ls(token=TOKEN, name='vos://d/') == NODES['vos://d'][0]
+    assert [c[1] for c in calls].count('/ls') == 1
+
+
+@pytest.mark.parametrize(
+    "size, nchunks",
+    [
+        (0, 0),
+        (1, 1),
+        (4 * 1024 * 1024, 1),
+        (4 * 1024 * 1024 + 1, 2),
+    ]
+)
+def test_chunked_upload(client, monkeypatch, tmp_path, size, nchunks):
+    sc, calls = client
+    monkeypatch.setattr(stc, 'sc_client', sc)
+    local = str(tmp_path / "upload.dat")
+    with open(local, "wb") as fd:
+        fd.write(b'x' * size)
+    stc.chunked_upload(TOKEN, local, 'vos://upload.dat')
+    assert len(calls) == nchunks
+    assert sum(len(c[2]) for c in calls) == size
+
+
+@pytest.mark.parametrize(
+    "error, headers",
+    [
+        (urllib3.exceptions.ProtocolError('Connection broken'), {}),
+        (urllib3.exceptions.ReadTimeoutError(None, None, 'timed out'), {}),
+        (requests.exceptions.ChunkedEncodingError('Connection broken'),
+         {'content-md5': 'x'}),
+    ]
+)
+def test_getFile_read_error(client, tmp_path, error, headers):
+    sc, calls = client
+    dl = _Download([b'part'], error=error, headers=headers)
+    sc._fetch.downloads[DATA_URL + '/d/a.fits'] = [dl]
+    dlname = str(tmp_path / "a.fits")
+    assert sc._getFile('vos://d/a.fits', dlname, {}) is None
+    assert dl.closed
+    assert not os.path.exists(dlname)
+
+
+def test_getFile_checksum(client, tmp_path):
+    sc, calls = client
+    md5 = base64.b64encode(hashlib.md5(b'data').digest()).decode()
+    bad = _Download([b'dat!'], headers={'content-md5': md5})
+    good = _Download([b'data'], headers={'content-md5': md5})
+    sc._fetch.downloads[DATA_URL + '/d/a.fits'] = [bad, good]
+    dlname = str(tmp_path / "a.fits")
+    assert sc._getFile('vos://d/a.fits', dlname, {}) is None
+    assert bad.closed and not os.path.exists(dlname)
+    assert sc._getFile('vos://d/a.fits', dlname, {}) == 'OK'
+    with open(dlname, 'rb') as fd:
+        assert fd.read() == b'data'
+
+
+def test_get_retries_failed_file(client, tmp_path):
+    sc, calls = client
+    sc._fetch.downloads[DATA_URL + '/d/a.fits'] = [
+        _Download([b'part'], error=urllib3.exceptions.ProtocolError('reset'))]
+    resp = sc._get(token=TOKEN, fr='vos://d/*.fits', to=str(tmp_path),
+                   verbose=False)
+    assert resp == ['OK', 'OK']
+    for f in ('a.fits', 'b.fits'):
+        with open(str(tmp_path / f), 'rb') as fd:
+            assert fd.read() == b'data'
+
+
+@pytest.mark.parametrize(
+    "to, nisdir",
+    [
+        ('vos://d', 2),
+        ('vos://d/', 0),
+        ('d/', 0),
+    ]
+)
+def test_put_destination(client, tmp_path, to, nisdir):
+    sc, calls = client
+    for name in ('x.dat', 'y.dat'):
+        with open(str(tmp_path / name), 'w') as fd:
+            fd.write(name)
+    resp = sc._put(token=TOKEN, fr=str(tmp_path / '*.dat'), to=to,
+                   verbose=False)
+    assert resp == ['OK', 'OK']
+    assert sorted(c[2]['name'] for c in calls if c[1] == '/put') == \
+        ['vos://d/x.dat', 'vos://d/y.dat']
+    assert [c[1] for c in calls].count('/isdir') == nisdir
@@ -80,3 +80,88 @@ def test_auth_token_to_dict(token, expected):
         expected_dict = None
     res = util.auth_token_to_dict(token)
     assert res == expected_dict
+
+
+@util.multimethod('test_util', 2, False)
+def _mm_func(a, b, c=None):
+    return ('two', a, b, c)
+
+@util.multimethod('test_util', 1, False)
+def _mm_func(a, b=None, c=None):
+    return ('one', a, b, c)
+
+
+class _MMClient(object):
+    @util.multimethod('_test_util', 2, True)
+    def get(self, a, b, c=None):
+        return ('two', self, a, b, c)
+
+    @util.multimethod('_test_util', 1, True)
+    def get(self, a, b=None, c=None):
+        return ('one', self, a, b, c)
+
+
+@pytest.mark.parametrize(
+    "args, kw, expected",
+    [
+        ((1,), {}, ('one', 1, None, None)),
+        ((1, 2), {}, ('two', 1, 2, None)),
+        ((1,), {'c': 3}, ('one', 1, None, 3)),
+    ]
+)
+def test_multimethod_dispatch(args, kw, expected):
+    assert _mm_func(*args, **kw) == expected
+    with pytest.raises(TypeError):
+        _mm_func(1, 2, 3)
+
+
+def test_multimethod_class_dispatch():
+    obj = _MMClient()
+    assert obj.get(1) == ('one', obj, 1, None, None)
+    assert obj.get(1, 2, c=3) == ('two', obj, 1, 2, 3)
+
+
+class _MMQuery(object):
+    '''Overloads laid out like queryClient.query(), the full signature is
+       registered last with no required args.
+    '''
+    @util.multimethod('_test_util', 2, True)
+    def query(self, token, query, adql=None, sql=None, fmt='csv', out=None):
+        return ('two', token, query, adql, sql, fmt, out)
+
+    @util.multimethod('_test_util', 1, True)
+    def query(self, optval, adql=None, sql=None, fmt='csv', out=None,
+              token=None):
+        return ('one', token, optval, adql, sql, fmt, out)
+
+    @util.multimethod('_test_util', 0, True)
+    def query(self, token=None, adql=None, sql=None, fmt='csv', out=None):
+        return ('full', token, adql, sql, fmt, out)
+
+
+@pytest.mark.parametrize(
+    "args, kw, expected",
+    [
+        ((TEST_TOKEN, 'SELECT 1'), {},
+         ('full', TEST_TOKEN, 'SELECT 1', None, 'csv', None)),
+        ((TEST_TOKEN, 'SELECT 1', None, 'votable'), {},
+         ('full', TEST_TOKEN, 'SELECT 1', None, 'votable', None)),
+        ((TEST_TOKEN, None, 'SELECT 1', 'csv', 'out.csv'), {},
+         ('full', TEST_TOKEN, None, 'SELECT 1', 'csv', 'out.csv')),
+        ((), {'sql': 'SELECT 1'},
+         ('full', None, None, 'SELECT 1', 'csv', None)),
+    ]
+)
+def test_multimethod_class_full_signature(args, kw, expected):
+    assert _MMQuery().query(*args, **kw) == expected
+
+
+def test_read_token_file_sees_changes(tmp_path):
+    tok_file = str(tmp_path / "id_token.unittest")
+    assert util.readTokenFile(tok_file) == ANON_TOKEN
+    with open(tok_file, "w") as fd:
+        fd.write(UNITTEST_OK_TOKEN + "\n")
+    assert util.readTokenFile(tok_file) == UNITTEST_OK_TOKEN
+    with open(tok_file, "w") as fd:
+        fd.write(SOME_USER + "\n")
+    assert util.readTokenFile(tok_file) == SOME_USER